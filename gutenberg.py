@@ -6,6 +6,7 @@ that emits WordPress Gutenberg block markup.
 """
 
 import re
+from html import escape as html_escape
 
 import mistune
 from mistune.plugins.footnotes import footnotes
@@ -17,6 +18,91 @@ from mistune.plugins.table import table
 # paragraph() can promote them to wp:image blocks.
 _IMAGE_SENTINEL = "\x00GUTENBERG_IMAGE\x00"
 
+# A raw HTML image: a <figure> around one <img> (with optional <figcaption>),
+# or a bare <img> tag
+_HTML_IMAGE_RE = re.compile(
+    r'<figure[^>]*>\s*<img\s+(?P<fig_attrs>[^>]+)\s*/?>\s*'
+    r'(?:<figcaption[^>]*>(?P<caption>.*?)</figcaption>)?\s*</figure>'
+    r'|<img\s+(?P<attrs>[^>]+)\s*/?>',
+    re.DOTALL | re.IGNORECASE,
+)
+# An HTML block made up of nothing but such images
+_HTML_IMAGES_ONLY_RE = re.compile(
+    rf'(?:\s*(?:{_HTML_IMAGE_RE.pattern}))+\s*', re.DOTALL | re.IGNORECASE,
+)
+_IMG_ATTR_RE = re.compile(r'(src|alt)\s*=\s*["\']([^"\']*)["\']')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Blank-line runs separating rendered blocks
+_BLOCK_SPLIT_RE = re.compile(r'\n{2,}')
+
+
+def _img_src_alt(img_attrs):
+    """Return (src, alt) from an <img> attribute string in a single scan.
+
+    src is None when missing or empty; alt defaults to "".
+    """
+    src = alt = None
+    for name, value in _IMG_ATTR_RE.findall(img_attrs):
+        if name == "src":
+            if src is None and value:
+                src = value
+        elif alt is None:
+            alt = value
+    return src, alt or ""
+
+
+def _html_image_parts(m):
+    """Return (src, alt, caption) for an _HTML_IMAGE_RE match.
+
+    The caption is the <figcaption> text with tags stripped, or None.
+    """
+    src, alt = _img_src_alt(m.group("fig_attrs") or m.group("attrs"))
+    caption = m.group("caption")
+    if caption:
+        caption = _TAG_RE.sub("", caption).strip() or None
+    return src, alt, caption
+
+
+def _html_block_images(html):
+    """(src, alt, caption) for each image of an images-only HTML block, else None."""
+    if not _HTML_IMAGES_ONLY_RE.fullmatch(html):
+        return None
+    images = [_html_image_parts(m) for m in _HTML_IMAGE_RE.finditer(html)]
+    return images if all(src for src, _, _ in images) else None
+
+
+def _inline_html_image(html):
+    """(src, alt) for an inline <img> tag with a src, else None."""
+    m = _HTML_IMAGE_RE.fullmatch(html)
+    if m:
+        src, alt, _ = _html_image_parts(m)
+        if src:
+            return src, alt
+    return None
+
+
+def _collect_image_sources(md, tokens, env, sources):
+    """Append every URL the renderer will pass to its image handler.
+
+    Inline text is parsed here, ahead of rendering, the same way
+    Markdown._iter_render would; rendering then reuses the parsed children.
+    """
+    for tok in tokens:
+        if "children" not in tok and "text" in tok:
+            tok["children"] = md.inline(tok.pop("text").strip(" \r\n\t\f"), env)
+        kind = tok["type"]
+        if kind == "image":
+            sources.append(tok["attrs"]["url"])
+        elif kind == "block_html":
+            sources.extend(src for src, _, _ in _html_block_images(tok["raw"]) or ())
+        elif kind == "inline_html":
+            image = _inline_html_image(tok["raw"])
+            if image:
+                sources.append(image[0])
+        if "children" in tok:
+            _collect_image_sources(md, tok["children"], env, sources)
+
 
 def _wp_image_block(url, alt, title=None, media_id=None):
     """Build a wp:image Gutenberg block string."""
@@ -60,12 +146,12 @@ class GutenbergRenderer(mistune.HTMLRenderer):
         if stripped.startswith(_IMAGE_SENTINEL) and stripped.endswith(_IMAGE_SENTINEL):
             return stripped.replace(_IMAGE_SENTINEL, "") + "\n\n"
 
-        # Handle HTML <img> tags that mistune passed through
-        processed = self._process_html_images(text)
+        # Images mixed with text stay inline
+        text = text.replace(_IMAGE_SENTINEL, "")
 
         return (
             f"<!-- wp:paragraph -->\n"
-            f"<p>{processed}</p>\n"
+            f"<p>{text}</p>\n"
             f"<!-- /wp:paragraph -->\n\n"
         )
 
@@ -77,7 +163,6 @@ class GutenbergRenderer(mistune.HTMLRenderer):
         )
 
     def block_code(self, code, info=None):
-        from html import escape as html_escape
         lang_attr = f' class="language-{info}"' if info else ""
         escaped = html_escape(code.rstrip('\n'))
         return (
@@ -116,7 +201,9 @@ class GutenbergRenderer(mistune.HTMLRenderer):
 
     def list_item(self, text):
         # Strip wrapping <p> that mistune adds for loose list items
-        text = re.sub(r"^<p>(.*)</p>\n?$", r"\1", text.strip(), flags=re.DOTALL)
+        text = text.strip()
+        if text.startswith("<p>") and text.endswith("</p>"):
+            text = text[3:-4]
         return f"<li>{text}</li>\n"
 
     # ------------------------------------------------------------------
@@ -124,11 +211,8 @@ class GutenbergRenderer(mistune.HTMLRenderer):
     # ------------------------------------------------------------------
 
     def image(self, text, url, title=None):
-        final_url, media_id = self.image_handler(url)
-        if not final_url:
-            return ""
-        block = _wp_image_block(final_url, text, title=title, media_id=media_id)
-        return f"{_IMAGE_SENTINEL}{block}{_IMAGE_SENTINEL}"
+        block = self._image_block(url, text, title)
+        return f"{_IMAGE_SENTINEL}{block}{_IMAGE_SENTINEL}" if block else ""
 
     def link(self, text, url, title=None):
         return f'<a href="{url}">{text}</a>'
@@ -137,54 +221,33 @@ class GutenbergRenderer(mistune.HTMLRenderer):
     # below — registered via renderer.register() after plugin init.
 
     # ------------------------------------------------------------------
-    # HTML image passthrough
+    # Raw HTML images
     # ------------------------------------------------------------------
 
-    def _process_html_images(self, text):
-        """Process any raw HTML <img>/<figure> tags via the image handler."""
-        figure_pattern = (
-            r'<figure[^>]*>\s*<img\s+([^>]+)\s*/?>\s*'
-            r'(?:<figcaption[^>]*>(.*?)</figcaption>)?\s*</figure>'
-        )
-
-        def _replace_figure(m):
-            img_attrs = m.group(1)
-            caption = m.group(2) or ""
-            src = re.search(r'src\s*=\s*["\']([^"\']+)["\']', img_attrs)
-            alt = re.search(r'alt\s*=\s*["\']([^"\']*)["\']', img_attrs)
-            if not src:
-                return m.group(0)
-            final_url, media_id = self.image_handler(src.group(1))
-            if not final_url:
-                return m.group(0)
-            caption_clean = re.sub(r'<[^>]+>', '', caption).strip() if caption else ""
-            return _wp_image_block(
-                final_url, alt.group(1) if alt else "",
-                title=caption_clean or None, media_id=media_id,
-            )
-
-        text = re.sub(figure_pattern, _replace_figure, text, flags=re.DOTALL | re.IGNORECASE)
-
-        standalone_img = r'<img\s+([^>]+)\s*/?>'
-
-        def _replace_img(m):
-            img_attrs = m.group(1)
-            src = re.search(r'src\s*=\s*["\']([^"\']+)["\']', img_attrs)
-            alt = re.search(r'alt\s*=\s*["\']([^"\']*)["\']', img_attrs)
-            if not src:
-                return m.group(0)
-            final_url, media_id = self.image_handler(src.group(1))
-            if not final_url:
-                return m.group(0)
-            return _wp_image_block(
-                final_url, alt.group(1) if alt else "",
-                media_id=media_id,
-            )
-
-        if '<!-- wp:image' not in text:
-            text = re.sub(standalone_img, _replace_img, text, flags=re.IGNORECASE)
-
-        return text
+    # Raw HTML is escaped (HTMLRenderer's default), except <img>/<figure>
+    # tags with a src, which go through the image handler like markdown
+    # images do.
+
+    def block_html(self, html):
+        images = _html_block_images(html)
+        if images is None:
+            return super().block_html(html)
+        blocks = (self._image_block(src, alt, caption) for src, alt, caption in images)
+        return "".join(f"{block}\n\n" for block in blocks if block)
+
+    def inline_html(self, html):
+        image = _inline_html_image(html)
+        if image is None:
+            return super().inline_html(html)
+        src, alt = image
+        return self.image(alt, src)
+
+    def _image_block(self, url, alt, title=None):
+        """Resolve url via the image handler into a wp:image block, or "" to drop it."""
+        final_url, media_id = self.image_handler(url)
+        if not final_url:
+            return ""
+        return _wp_image_block(final_url, alt, title=title, media_id=media_id)
 
 
 # ------------------------------------------------------------------
@@ -279,26 +342,34 @@ _ADMONITION_STYLES = {
 }
 
 
-def _render_gfm_admonition(renderer, text, name, **attrs):
-    """Render a GFM admonition as a wp:quote with GitHub-style icon and border."""
-    style = _ADMONITION_STYLES.get(name, {"icon": "", "color": "#666"})
-    icon = style["icon"]
+def _admonition_open(name, style):
+    """Build everything an admonition emits before its body."""
     color = style["color"]
-    title = (
-        f"<!-- wp:paragraph -->\n"
-        f'<p style="color: {color}; font-weight: 500;">'
-        f"{icon}{name.capitalize()}</p>\n"
-        f"<!-- /wp:paragraph -->\n"
-    )
     return (
         f'<!-- wp:quote {{"className":"is-admonition is-admonition-{name}"}} -->\n'
         f'<blockquote class="wp-block-quote is-admonition is-admonition-{name}"'
         f' style="border-left-color: {color};">'
-        f"{title}{text}</blockquote>\n"
-        f"<!-- /wp:quote -->\n\n"
+        f"<!-- wp:paragraph -->\n"
+        f'<p style="color: {color}; font-weight: 500;">'
+        f'{style["icon"]}{name.capitalize()}</p>\n'
+        f"<!-- /wp:paragraph -->\n"
     )
 
 
+# Opening markup (quote + icon title) depends only on the admonition type
+_ADMONITION_OPEN = {
+    name: _admonition_open(name, style) for name, style in _ADMONITION_STYLES.items()
+}
+
+
+def _render_gfm_admonition(renderer, text, name, **attrs):
+    """Render a GFM admonition as a wp:quote with GitHub-style icon and border."""
+    opening = _ADMONITION_OPEN.get(name)
+    if opening is None:
+        opening = _admonition_open(name, {"icon": "", "color": "#666"})
+    return f"{opening}{text}</blockquote>\n<!-- /wp:quote -->\n\n"
+
+
 def gfm_admonition(md):
     """Mistune plugin: GFM admonition syntax in blockquotes."""
     md.block.register("block_quote", None, _parse_gfm_admonition)
@@ -309,20 +380,26 @@ def gfm_admonition(md):
 class GutenbergConverter:
     """Converts markdown to WordPress Gutenberg blocks."""
 
-    def __init__(self, image_handler=None):
+    def __init__(self, image_handler=None, image_prefetcher=None):
         """
         Initialize converter.
 
         Args:
             image_handler: Optional callable(image_url) -> (final_url, media_id)
                           If None, images are left as-is with no media ID.
+            image_prefetcher: Optional callable(image_urls), called once per
+                          document before rendering with the distinct URLs
+                          image_handler is about to receive, in order.
         """
         self._renderer = GutenbergRenderer(image_handler=image_handler)
+        self._image_prefetcher = image_prefetcher
 
         self._md = mistune.Markdown(
             renderer=self._renderer,
             plugins=[table, footnotes, strikethrough, gfm_admonition],
         )
+        if image_prefetcher is not None:
+            self._md.before_render_hooks.append(self._prefetch_images)
 
         # Register table overrides *after* plugins so we replace the
         # default renderers the table plugin just wired up.
@@ -332,11 +409,18 @@ class GutenbergConverter:
         self._renderer.register("table_row", _gutenberg_table_row)
         self._renderer.register("table_cell", _gutenberg_table_cell)
 
+    def _prefetch_images(self, md, state):
+        """before_render hook: hand the document's image URLs to the prefetcher."""
+        sources = []
+        _collect_image_sources(md, state.tokens, state.env, sources)
+        if sources:
+            self._image_prefetcher(list(dict.fromkeys(sources)))
+
     def convert(self, markdown_content):
         """Convert markdown to Gutenberg block format."""
         raw = self._md(markdown_content)
 
         # Collapse runs of blank lines and trim, then re-join blocks
         # with double-newlines for Gutenberg spacing.
-        blocks = [b.strip() for b in re.split(r'\n{2,}', raw) if b.strip()]
+        blocks = [b for b in map(str.strip, _BLOCK_SPLIT_RE.split(raw)) if b]
         return '\n\n'.join(blocks)
@@ -1,6 +1,7 @@
 """Shared fixtures for wp-poster test suite."""
 
 import importlib.util
+import json
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -25,6 +26,16 @@ from gutenberg import GutenbergConverter  # noqa: E402
 # Fixtures
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test once with orjson (when installed) and once with stdlib json."""
+    if request.param == "json":
+        monkeypatch.setattr(wp_post, "orjson", None)
+    elif wp_post.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
 @pytest.fixture
 def wp():
     """A WordPressPost instance pointed at a dummy site."""
@@ -65,13 +76,19 @@ def md_file(tmp_path):
 def mock_response():
     """Factory returning a mock requests.Response with configurable status_code and json.
 
+    The JSON is exposed both via .json() and as raw .content bytes.
+
     Usage:
         resp = mock_response(201, {"id": 1, "link": "...", "title": {"rendered": "T"}})
     """
-    def _make(status_code=200, json_data=None, text=""):
+    def _make(status_code=200, json_data=None, text="", headers=None):
         resp = MagicMock()
         resp.status_code = status_code
-        resp.json.return_value = json_data if json_data is not None else {}
+        data = json_data if json_data is not None else {}
+        resp.json.return_value = data
+        resp.content = json.dumps(data).encode()  # what orjson parses
         resp.text = text
+        if headers is not None:
+            resp.headers = headers
         return resp
     return _make
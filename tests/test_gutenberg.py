@@ -273,6 +273,74 @@ class TestImages:
         assert "wp:image" in result
         assert result.count("wp:paragraph") >= 2
 
+    def test_prefetcher_gets_exactly_the_handled_urls(self):
+        handled, prefetched = [], []
+        c = GutenbergConverter(
+            image_handler=lambda url: (handled.append(url) or url, None),
+            image_prefetcher=prefetched.extend,
+        )
+        c.convert(
+            "![a](a.png)\n\n```\n![b](b.png)\n```\n\n`![c](c.png)` and ![é](é.png)\n\n"
+            '<img src="d.png">\n\n![a again](a.png)'
+        )
+        assert prefetched == list(dict.fromkeys(handled))
+        assert prefetched == ["a.png", "%C3%A9.png", "d.png"]
+
+    def test_inline_image_in_text_converted_once(self, converter):
+        result = converter.convert("Before ![alt](https://img.example.com/pic.jpg) after")
+        assert result.count("<!-- wp:image") == 1
+        assert "\x00" not in result
+
+
+class TestHtmlImages:
+    def test_img_tag_becomes_image_block(self):
+        c = GutenbergConverter(image_handler=lambda url: (url, 7))
+        result = c.convert('<img alt="A cat" class="x" src="https://img.example.com/cat.jpg">')
+        assert 'src="https://img.example.com/cat.jpg" alt="A cat"' in result
+        assert '"id":7' in result
+        assert "&lt;img" not in result
+
+    def test_figure_caption(self, converter):
+        result = converter.convert(
+            "<figure><img src='https://img.example.com/a.png'>"
+            "<figcaption><em>Cap</em></figcaption></figure>"
+        )
+        assert 'alt=""' in result
+        assert '<figcaption class="wp-element-caption">Cap</figcaption>' in result
+        assert result.count("<!-- wp:image") == 1
+
+    def test_figure_and_img_lines_each_converted(self):
+        seen = []
+        c = GutenbergConverter(image_handler=lambda url: (seen.append(url) or url, None))
+        result = c.convert(
+            '<figure><img src="https://img.example.com/a.png"></figure>\n'
+            '<img src="https://img.example.com/b.png">'
+        )
+        assert seen == ["https://img.example.com/a.png", "https://img.example.com/b.png"]
+        assert result.count("<!-- wp:image") == 2
+
+    def test_inline_img_in_paragraph(self):
+        seen = []
+        c = GutenbergConverter(image_handler=lambda url: (seen.append(url) or url, None))
+        result = c.convert('See <img src="https://img.example.com/a.png"> here.')
+        assert seen == ["https://img.example.com/a.png"]
+        assert "wp:paragraph" in result
+        assert "\x00" not in result
+
+    def test_unresolved_img_dropped(self):
+        c = GutenbergConverter(image_handler=lambda url: (None, None))
+        assert c.convert('<img src="missing.png">') == ""
+
+    def test_img_without_src_escaped(self, converter):
+        result = converter.convert('<img alt="no source">')
+        assert "&lt;img alt=" in result
+        assert "wp:image" not in result
+
+    def test_other_html_still_escaped(self, converter):
+        result = converter.convert('<div><img src="https://img.example.com/a.png"></div>')
+        assert "&lt;div&gt;" in result
+        assert "wp:image" not in result
+
 
 # ---------------------------------------------------------------------------
 # Full document round-trip
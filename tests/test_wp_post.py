@@ -3,10 +3,12 @@
 import json
 import os
 import sys
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock, call
 
 import pytest
+import requests
 import yaml
 
 wp_post = sys.modules["wp_post"]
@@ -17,6 +19,10 @@ find_translation_siblings = wp_post.find_translation_siblings
 write_msls_links = wp_post.write_msls_links
 init_network_config = wp_post.init_network_config
 
+# API bodies, error bodies and the disk cache are decoded with orjson when it
+# is installed; exercise that path and the stdlib fallback alike.
+pytestmark = pytest.mark.usefixtures("json_backend")
+
 
 # ===========================================================================
 # 1. Missing title validation  (highest priority)
@@ -77,6 +83,10 @@ class TestResolveFormat:
     def test_default_is_raw(self):
         assert resolve_format(False, False, {}, {}) == "raw"
 
+    def test_unknown_values_fall_through(self):
+        assert resolve_format(False, False, {"format": "html"}, {"default_format": "markdown"}) == "markdown"
+        assert resolve_format(False, False, {"format": ["raw"]}, {"default_format": "bogus"}) == "raw"
+
 
 # ===========================================================================
 # 3. File parsing
@@ -112,6 +122,71 @@ class TestParseRawFile:
         assert fm == {}
         assert content == "just body"
 
+    def test_body_rule_kept(self, wp, tmp_path):
+        path = tmp_path / "rule.md"
+        path.write_text("---\ntitle: T\n---\nabove\n\n---\n\nbelow\n")
+        fm, content = wp.parse_raw_file(str(path))
+        assert fm == {"title": "T"}
+        assert content == "above\n\n---\n\nbelow"
+
+    def test_open_file_object(self, wp, tmp_path):
+        path = tmp_path / "crlf.md"
+        path.write_bytes(b"---\r\ntitle: T\r\n---\r\nline one\r\nline two\r\n")
+        with wp_post._open_source(str(path)) as f:
+            fm, content = wp.parse_raw_file(f)
+        assert fm == {"title": "T"}
+        assert content == "line one\nline two"
+
+    def test_open_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            wp_post._open_source(str(tmp_path / "missing.md"))
+
+
+class TestParseCache:
+    def test_repeat_parse_hits_cache(self, wp, md_file):
+        path = md_file({"title": "T"}, "body")
+        first = wp.parse_raw_file(path)
+        assert wp.parse_raw_file(path)[0] is first[0]
+
+    def test_edit_invalidates(self, wp, md_file):
+        path = md_file({"title": "Old"}, "body")
+        assert wp.parse_frontmatter_only(path)["title"] == "Old"
+        Path(path).write_text("---\ntitle: New title\n---\nbody", encoding="utf-8")
+        assert wp.parse_frontmatter_only(path)["title"] == "New title"
+
+    def test_cached_frontmatter_is_read_only(self, wp, md_file):
+        path = md_file({"title": "T"}, "body")
+        fm, _ = wp.parse_raw_file(path)
+        with pytest.raises(TypeError):
+            fm["title"] = "changed"
+
+
+class TestConvertMarkdown:
+    def test_converter_reused_across_calls(self, wp):
+        first = wp.convert_markdown("# One")
+        converter = wp._converter
+        second = wp.convert_markdown("# Two")
+        assert wp._converter is converter
+        assert "One" in first and "Two" in second and "One" not in second
+
+
+class TestFastYamlDump:
+    @pytest.mark.parametrize("fm", [
+        {},
+        {"title": "Hello World", "status": "draft", "id": 5, "sticky": True, "parent": None},
+        {"title": "T", "tags": ["python", "release"], "categories": []},
+        {"title": "yes"},
+        {"title": "123", "tags": ["ok", "1"]},
+        {"title": "Colon: inside"},
+        {"title": "x" * 90},
+        {"title": "T", "meta": {"key": "value"}},
+        {"title": "T", "rating": 4.5},
+        {"a_very_long_frontmatter_key_name_that_goes_on_and_on_x":
+            "a fairly long plain value that yaml will fold over"},
+    ])
+    def test_matches_yaml_dump(self, fm):
+        assert wp_post._fast_yaml_dump_flat(fm) == yaml.dump(fm, default_flow_style=False)
+
 
 # ===========================================================================
 # 4. post_to_wordpress — success / failure paths
@@ -119,20 +194,21 @@ class TestParseRawFile:
 
 def _wp_api_router(post_url, categories=None, tags=None, users=None):
     """Return a side_effect callable that routes based on URL for requests.get."""
-    def _router(url, **kwargs):
+    def _json(data):
         resp = MagicMock()
+        resp.status_code = 200
+        resp.json.return_value = data
+        resp.content = json.dumps(data).encode()
+        return resp
+
+    def _router(url, **kwargs):
         if "/categories" in url:
-            resp.status_code = 200
-            resp.json.return_value = categories or []
-            return resp
+            return _json(categories or [])
         if "/tags" in url:
-            resp.status_code = 200
-            resp.json.return_value = tags or []
-            return resp
+            return _json(tags or [])
         if "/users" in url:
-            resp.status_code = 200
-            resp.json.return_value = users or []
-            return resp
+            return _json(users or [])
+        resp = MagicMock()
         resp.status_code = 404
         return resp
     return _router
@@ -202,6 +278,18 @@ class TestPostSuccess:
         assert result["success"] is True
         assert "/posts/99" in mock_post.call_args[0][0]
 
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_pre_parsed_skips_file_read(self, mock_get, mock_post, wp, mock_response, tmp_path):
+        mock_post.return_value = mock_response(200, {
+            "id": 5, "link": "https://example.com/?p=5",
+            "title": {"rendered": "T"},
+        })
+        missing = str(tmp_path / "not-on-disk.md")
+        result = wp.post_to_wordpress(missing, raw=True, pre_parsed=({"title": "T", "id": 5}, "body"))
+        assert result["success"] is True
+        assert mock_post.call_args[1]["json"]["content"] == "body"
+
 
 class TestPostCategories:
     @patch("wp_post.requests.post")
@@ -258,6 +346,42 @@ class TestPostTags:
         post_data = mock_post.call_args[1]["json"]
         assert post_data["tags"] == [3]
 
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_duplicate_tags_sent_once(self, mock_get, mock_post, wp, md_file, mock_response):
+        path = md_file({"title": "T", "tags": ["Python", "new", "python", "Python", "new"]}, "body")
+        mock_get.side_effect = _wp_api_router(
+            "https://example.com",
+            tags=[{"name": "Python", "slug": "python", "id": 3}],
+        )
+        mock_post.side_effect = [
+            mock_response(201, {"id": 88}),  # create_tag
+            mock_response(201, {
+                "id": 1, "link": "https://example.com/?p=1",
+                "title": {"rendered": "T"},
+            }),
+        ]
+        wp.post_to_wordpress(path, raw=True)
+        assert mock_post.call_count == 2
+        post_data = mock_post.call_args[1]["json"]
+        assert post_data["tags"] == [3, 88]
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_numeric_tag_matches_existing(self, mock_get, mock_post, wp, md_file, mock_response):
+        path = md_file({"title": "T", "tags": [2024]}, "body")
+        mock_get.side_effect = _wp_api_router(
+            "https://example.com",
+            tags=[{"name": "2024", "slug": "2024", "id": 7}],
+        )
+        mock_post.return_value = mock_response(201, {
+            "id": 1, "link": "https://example.com/?p=1",
+            "title": {"rendered": "T"},
+        })
+        wp.post_to_wordpress(path, raw=True)
+        assert mock_post.call_count == 1
+        assert mock_post.call_args[1]["json"]["tags"] == [7]
+
     @patch("wp_post.requests.post")
     @patch("wp_post.requests.get")
     def test_new_tag_created(self, mock_get, mock_post, wp, md_file, mock_response):
@@ -369,6 +493,34 @@ class TestPostFeaturedImage:
         assert post_data["featured_media"] == 50
 
 
+class TestPostLookupsConcurrent:
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_author_and_terms_fetched_in_parallel(self, mock_get, mock_post, wp, md_file, mock_response):
+        path = md_file({"title": "T", "author": "editor", "categories": ["Tech"]}, "body")
+        router = _wp_api_router(
+            "https://example.com",
+            categories=[{"name": "Tech", "slug": "tech", "id": 5}],
+            users=[{"slug": "editor", "name": "Editor", "id": 7}],
+        )
+        # Each lookup waits for the other; a serial prep phase would time out here
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def get(url, **kwargs):
+            both_in_flight.wait()
+            return router(url, **kwargs)
+
+        mock_get.side_effect = get
+        mock_post.return_value = mock_response(201, {
+            "id": 1, "link": "https://example.com/?p=1",
+            "title": {"rendered": "T"},
+        })
+        wp.post_to_wordpress(path, raw=True)
+        post_data = mock_post.call_args[1]["json"]
+        assert post_data["author"] == 7
+        assert post_data["categories"] == [5]
+
+
 class TestPostRankMath:
     @patch("wp_post.requests.post")
     @patch("wp_post.requests.get")
@@ -406,6 +558,17 @@ class TestPostFailure:
         result = wp.post_to_wordpress(path, raw=True)
         assert result["success"] is False
         assert result["status_code"] == 403
+        assert result["error"] == "Forbidden"
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_author_permission_error(self, mock_get, mock_post, wp, md_file, mock_response):
+        path = md_file({"title": "T"}, "body")
+        body = {"code": "rest_cannot_edit_others", "message": "Not allowed."}
+        mock_post.return_value = mock_response(403, text=json.dumps(body))
+        result = wp.post_to_wordpress(path, raw=True)
+        assert result["error"] == "Permission denied: cannot set author to another user. Not allowed."
+        mock_post.return_value.json.assert_not_called()
 
 
 class TestPostCustomTaxonomies:
@@ -415,17 +578,11 @@ class TestPostCustomTaxonomies:
         path = md_file({"title": "T", "taxonomies": {"genre": ["fiction"]}}, "body")
 
         def get_router(url, **kwargs):
-            resp = MagicMock()
             if "/taxonomies/genre" in url:
-                resp.status_code = 200
-                resp.json.return_value = {"rest_base": "genre"}
-                return resp
+                return mock_response(200, {"rest_base": "genre"})
             if "/genre" in url:
-                resp.status_code = 200
-                resp.json.return_value = [{"name": "fiction", "slug": "fiction", "id": 33}]
-                return resp
-            resp.status_code = 404
-            return resp
+                return mock_response(200, [{"name": "fiction", "slug": "fiction", "id": 33}])
+            return mock_response(404)
 
         mock_get.side_effect = get_router
         mock_post.return_value = mock_response(201, {
@@ -441,6 +598,42 @@ class TestPostCustomTaxonomies:
 # 5. Helper methods
 # ===========================================================================
 
+class TestParseResponse:
+    def test_orjson_decodes_raw_content(self, monkeypatch):
+        fake = MagicMock()
+        fake.loads.side_effect = json.loads
+        monkeypatch.setattr(wp_post, "orjson", fake)
+        resp = MagicMock(content=b'[{"id": 1}]')
+        assert wp_post._parse(resp) == [{"id": 1}]
+        fake.loads.assert_called_once_with(b'[{"id": 1}]')
+        resp.json.assert_not_called()
+
+    def test_falls_back_to_response_json(self, mock_response):
+        assert wp_post._parse(mock_response(200, {"id": 2})) == {"id": 2}
+
+    @staticmethod
+    def _bom_response(status_code, data):
+        resp = requests.models.Response()
+        resp.status_code = status_code
+        resp._content = b"\xef\xbb\xbf" + json.dumps(data).encode()
+        return resp
+
+    def test_bom_prefixed_body(self):
+        assert wp_post._parse(self._bom_response(200, [{"id": 3}])) == [{"id": 3}]
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_bom_prefixed_post_response(self, mock_get, mock_post, wp, md_file):
+        path = md_file({"title": "T"}, "body")
+        mock_post.return_value = self._bom_response(201, {
+            "id": 12, "link": "https://example.com/?p=12",
+            "title": {"rendered": "T"},
+        })
+        result = wp.post_to_wordpress(path, raw=True)
+        assert result["success"] is True
+        assert result["id"] == 12
+
+
 class TestGetUserId:
     def test_int_passthrough(self, wp):
         assert wp.get_user_id(42) == 42
@@ -460,6 +653,16 @@ class TestGetUserId:
         mock_get.return_value = mock_response(200, [])
         assert wp.get_user_id("nobody") is None
 
+    @patch("wp_post.requests.get")
+    def test_lookup_cached_by_name_and_slug(self, mock_get, wp, mock_response):
+        mock_get.return_value = mock_response(200, [
+            {"slug": "jdoe", "name": "Jane Doe", "id": 5}
+        ])
+        assert wp.get_user_id("Jane Doe") == 5
+        assert wp.get_user_id("Jane Doe") == 5
+        assert wp.get_user_id("jdoe") == 5
+        mock_get.assert_called_once()
+
 
 class TestGetCategories:
     @patch("wp_post.requests.get")
@@ -472,12 +675,54 @@ class TestGetCategories:
         assert cats["Tech"] == 1
         assert cats["tech"] == 1
         assert cats["News"] == 2
+        assert mock_get.call_args[1]["params"]["_fields"] == "id,name,slug"
 
     @patch("wp_post.requests.get")
     def test_failure(self, mock_get, wp, mock_response):
         mock_get.return_value = mock_response(500)
         assert wp.get_categories() == {}
 
+    @patch("wp_post.requests.get")
+    def test_cached_after_first_fetch(self, mock_get, wp, mock_response):
+        mock_get.return_value = mock_response(200, [{"name": "Tech", "slug": "tech", "id": 1}])
+        wp.get_categories()
+        assert wp.get_categories()["Tech"] == 1
+        assert mock_get.call_count == 1
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_create_updates_cache(self, mock_get, mock_post, wp, mock_response):
+        mock_get.return_value = mock_response(200, [])
+        mock_post.return_value = mock_response(201, {"id": 9, "slug": "new-cat"})
+        wp.get_categories()
+        wp.create_category("New Cat")
+        cats = wp.get_categories()
+        assert cats["New Cat"] == 9
+        assert cats["new-cat"] == 9
+        assert mock_get.call_count == 1
+
+    @patch("wp_post.requests.get")
+    def test_fetches_all_pages(self, mock_get, wp, mock_response):
+        def pager(url, **kwargs):
+            page = kwargs["params"].get("page", 1)
+            return mock_response(200, [{"name": f"Cat{page}", "slug": f"cat{page}", "id": page}],
+                                 headers={"X-WP-TotalPages": "3"})
+
+        mock_get.side_effect = pager
+        cats = wp.get_categories()
+        assert cats["Cat1"] == 1
+        assert cats["Cat2"] == 2
+        assert cats["cat3"] == 3
+        assert mock_get.call_count == 3
+
+    @patch("wp_post.requests.get")
+    def test_invalidate_refetches(self, mock_get, wp, mock_response):
+        mock_get.return_value = mock_response(200, [])
+        wp.get_categories()
+        wp.invalidate_taxonomy_cache()
+        wp.get_categories()
+        assert mock_get.call_count == 2
+
 
 class TestGetTags:
     @patch("wp_post.requests.get")
@@ -519,6 +764,96 @@ class TestCreateTag:
         assert wp.create_tag("bad") is None
 
 
+class TestTaxonomyTerms:
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_fetched_once_and_extended_by_create(self, mock_get, mock_post, wp, mock_response):
+        def get_router(url, **kwargs):
+            if "/taxonomies/genre" in url:
+                return mock_response(200, {"rest_base": "genres"})
+            return mock_response(200, [{"name": "Fiction", "slug": "fiction", "id": 33}])
+
+        mock_get.side_effect = get_router
+        mock_post.return_value = mock_response(201, {"id": 34, "slug": "poetry"})
+        assert wp.get_taxonomy_terms("genre")["fiction"] == 33
+        assert wp.create_taxonomy_term("genre", "Poetry") == 34
+        terms = wp.get_taxonomy_terms("genre")
+        assert terms["Poetry"] == 34
+        assert terms["poetry"] == 34
+        assert mock_get.call_count == 2  # rest_base + one term listing
+
+
+class TestCreateTerms:
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_batch_when_supported(self, mock_get, mock_post, wp, mock_response):
+        mock_get.return_value = mock_response(200, {"namespaces": ["wp/v2", "batch/v1"]})
+        mock_post.return_value = mock_response(207, {"responses": [
+            {"status": 201, "body": {"id": 1, "slug": "a"}},
+            {"status": 201, "body": {"id": 2, "slug": "b"}},
+        ]})
+        created = wp._create_terms([("tags", "A"), ("categories", "B")])
+        assert created == {("tags", "A"): 1, ("categories", "B"): 2}
+        assert mock_post.call_count == 1
+        url, = mock_post.call_args[0]
+        assert url == "https://example.com/wp-json/batch/v1"
+        sub = mock_post.call_args[1]["json"]["requests"]
+        assert sub[0] == {"method": "POST", "path": "/wp/v2/tags", "body": {"name": "A"}}
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_failed_sub_request_retried_serially(self, mock_get, mock_post, wp, mock_response):
+        mock_get.return_value = mock_response(200, {"namespaces": ["batch/v1"]})
+        mock_post.side_effect = [
+            mock_response(207, {"responses": [
+                {"status": 201, "body": {"id": 1}},
+                {"status": 400, "body": {"code": "rest_batch_not_allowed"}},
+            ]}),
+            mock_response(201, {"id": 9}),
+        ]
+        created = wp._create_terms([("tags", "A"), ("genres", "B")])
+        assert created == {("tags", "A"): 1, ("genres", "B"): 9}
+        assert "/wp/v2/genres" in mock_post.call_args[0][0]
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_serial_without_batch_endpoint(self, mock_get, mock_post, wp, mock_response):
+        mock_get.return_value = mock_response(200, {"namespaces": ["wp/v2"]})
+        mock_post.side_effect = [mock_response(201, {"id": n}) for n in (1, 2, 3, 4)]
+        assert wp._create_terms([("tags", "A"), ("tags", "B")]) == {("tags", "A"): 1, ("tags", "B"): 2}
+        assert wp._create_terms([("tags", "C"), ("tags", "D")]) == {("tags", "C"): 3, ("tags", "D"): 4}
+        # The capability probe runs once per instance
+        assert mock_get.call_count == 1
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_post_creates_new_terms_in_one_batch(self, mock_get, mock_post, wp, md_file, mock_response):
+        path = md_file({"title": "T", "categories": ["Tech", "New"], "tags": ["fresh"]}, "body")
+        router = _wp_api_router(
+            "https://example.com",
+            categories=[{"name": "Tech", "slug": "tech", "id": 5}],
+        )
+
+        def get(url, **kwargs):
+            if url.endswith("/wp-json/"):
+                return mock_response(200, {"namespaces": ["batch/v1"]})
+            return router(url, **kwargs)
+
+        mock_get.side_effect = get
+        mock_post.side_effect = [
+            mock_response(207, {"responses": [
+                {"status": 201, "body": {"id": 6, "slug": "new"}},
+                {"status": 201, "body": {"id": 7, "slug": "fresh"}},
+            ]}),
+            mock_response(201, {"id": 1, "link": "https://example.com/?p=1", "title": {"rendered": "T"}}),
+        ]
+        wp.post_to_wordpress(path, raw=True)
+        assert mock_post.call_count == 2
+        post_data = mock_post.call_args[1]["json"]
+        assert post_data["categories"] == [5, 6]
+        assert post_data["tags"] == [7]
+
+
 class TestUpdateRankmathMeta:
     @patch("wp_post.requests.post")
     def test_key_mapping(self, mock_post, wp, mock_response):
@@ -547,6 +882,69 @@ class TestUpdateRankmathMeta:
         mock_post.assert_not_called()
 
 
+class TestFindActiveConfig:
+    def test_local_config_wins(self, tmp_path, monkeypatch):
+        home = tmp_path / "home"
+        home.mkdir()
+        (home / ".wp-poster.json").write_text("{}")
+        project = tmp_path / "project" / "sub"
+        project.mkdir(parents=True)
+        (tmp_path / "project" / ".wp-poster.json").write_text("{}")
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(project)
+        assert wp_post.find_active_config() == tmp_path / "project" / ".wp-poster.json"
+
+    def test_falls_back_to_user_global(self, tmp_path, monkeypatch):
+        home = tmp_path / "home"
+        home.mkdir()
+        (home / ".wp-poster.json").write_text("{}")
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(elsewhere)
+        assert wp_post.find_active_config() == home / ".wp-poster.json"
+
+    def test_config_paths_dedupes_aliased_file(self, tmp_path, monkeypatch):
+        home = tmp_path / "home"
+        (home / ".config" / "wp-poster").mkdir(parents=True)
+        (home / ".wp-poster.json").write_text("{}")
+        (home / ".config" / "wp-poster" / "config.json").symlink_to(home / ".wp-poster.json")
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(elsewhere)
+        names = [name for name, _, _ in wp_post.get_config_paths()]
+        assert "User global" in names
+        assert "XDG config" not in names
+
+
+class TestLoadConfig:
+    def test_cached_parse_not_mutated_by_callers(self, tmp_path, monkeypatch):
+        (tmp_path / ".wp-poster.json").write_text('{"site_url": "https://a.example", "username": "u"}')
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("WP_SITE_URL", raising=False)
+        first = wp_post.load_config()
+        first["site_url"] = "https://changed.example"
+        assert wp_post.load_config()["site_url"] == "https://a.example"
+
+    def test_env_override_applied_on_every_call(self, tmp_path, monkeypatch):
+        (tmp_path / ".wp-poster.json").write_text('{"username": "file-user"}')
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("WP_USERNAME", raising=False)
+        assert wp_post.load_config()["username"] == "file-user"
+        monkeypatch.setenv("WP_USERNAME", "env-user")
+        assert wp_post.load_config()["username"] == "env-user"
+
+    def test_rewritten_config_reread(self, tmp_path, monkeypatch):
+        config = tmp_path / ".wp-poster.json"
+        config.write_text('{"site_url": "https://old.example"}')
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("WP_SITE_URL", raising=False)
+        assert wp_post.load_config()["site_url"] == "https://old.example"
+        config.write_text('{"site_url": "https://new.example/"}')
+        assert wp_post.load_config()["site_url"] == "https://new.example/"
+
+
 # ===========================================================================
 # 6. Writeback frontmatter (id/slug after create)
 # ===========================================================================
@@ -983,6 +1381,7 @@ class TestInitNetworkConfig:
             os.chdir(original_cwd)
 
         assert result is True
+        assert mock_get.call_args[1]["params"] == {"_fields": "id,name"}
 
         # Check root config
         with open(tmp_path / '.wp-poster.json') as f:
@@ -1188,17 +1587,13 @@ class TestImageDedup:
 
         def routed_get(url, **kwargs):
             slug = kwargs.get("params", {}).get("slug", "")
-            resp = MagicMock()
-            resp.status_code = 200
             if slug == "hero":
                 # The orphan canonical that the OLD code would have matched
-                resp.json.return_value = [{
+                return mock_response(200, [{
                     "id": 584, "slug": "hero",
                     "source_url": "https://example.com/wp-content/uploads/hero.webp",
-                }]
-            else:
-                resp.json.return_value = []
-            return resp
+                }])
+            return mock_response(200, [])
         mock_get.side_effect = routed_get
         mock_post.return_value = mock_response(201, {
             "id": 9999,
@@ -1267,3 +1662,229 @@ class TestImageDedup:
         wp.post_to_wordpress(path, raw=True)
 
         assert wp._current_article_scope is None
+
+
+class TestPrefetchImages:
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_inline_images_uploaded_once_before_render(self, mock_get, mock_post, wp, tmp_path, mock_response):
+        (tmp_path / "a.jpg").write_bytes(b"a")
+        (tmp_path / "b.png").write_bytes(b"b")
+
+        def upload(url, **kwargs):
+            name = kwargs["headers"]["Content-Disposition"].split('"')[1]
+            return mock_response(201, {"id": 1 if name == "a.jpg" else 2,
+                                       "source_url": f"https://example.com/{name}"})
+
+        mock_post.side_effect = upload
+        md = (
+            f"![A]({tmp_path / 'a.jpg'})\n\n"
+            f"Some text.\n\n![B]({tmp_path / 'b.png'})\n\n"
+            f"![A again]({tmp_path / 'a.jpg'})"
+        )
+        out = wp.convert_markdown(md)
+        assert mock_post.call_count == 2
+        assert '"id":1' in out and '"id":2' in out
+        assert "https://example.com/a.jpg" in out
+
+    @patch("wp_post.requests.post")
+    def test_missing_local_files_not_prefetched(self, mock_post, wp, tmp_path):
+        wp._prefetch_images([str(tmp_path / "nope.jpg"), str(tmp_path / "gone.jpg")])
+        mock_post.assert_not_called()
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_images_in_code_not_uploaded(self, mock_get, mock_post, wp, tmp_path):
+        img = tmp_path / "a.jpg"
+        img.write_bytes(b"a")
+        md = (
+            f"```markdown\n![x]({img})\n```\n\n"
+            f"~~~\n![y]({img})\n~~~\n\n"
+            f"Write `![z]({img})` to embed."
+        )
+        out = wp.convert_markdown(md)
+        mock_post.assert_not_called()
+        mock_get.assert_not_called()
+        assert "wp:image" not in out
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_non_ascii_local_paths(self, mock_get, mock_post, wp, tmp_path, mock_response):
+        (tmp_path / "héllo.png").write_bytes(b"h")
+        (tmp_path / "wörld.png").write_bytes(b"w")
+        uploaded = []
+
+        def upload(url, **kwargs):
+            name = kwargs["headers"]["Content-Disposition"].split('"')[1]
+            uploaded.append(name)
+            return mock_response(201, {"id": len(uploaded), "source_url": f"https://example.com/{len(uploaded)}.png"})
+
+        mock_post.side_effect = upload
+        out = wp.convert_markdown(f"![h]({tmp_path / 'héllo.png'})\n\n![w]({tmp_path / 'wörld.png'})")
+        assert sorted(uploaded) == ["héllo.png", "wörld.png"]
+        assert out.count("<!-- wp:image") == 2
+        assert "https://example.com/1.png" in out and "https://example.com/2.png" in out
+
+    @patch("wp_post.requests.get")
+    def test_failed_remote_image_resolved_once(self, mock_get, wp):
+        mock_get.return_value = MagicMock(status_code=404)
+        url = "https://img.example.com/logo.png"
+        assert wp.process_image_url(url) == (url, None)
+        calls = mock_get.call_count
+        assert calls > 0
+        assert wp.process_image_url(url) == (url, None)
+        assert mock_get.call_count == calls
+
+
+class TestDiskCache:
+    @pytest.fixture
+    def cached_wp(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        with patch("wp_post.atexit.register"):
+            yield lambda: WordPressPost("https://example.com", "user", "pass", disk_cache=True)
+
+    @patch("wp_post.requests.get")
+    def test_warm_run_skips_lookups(self, mock_get, cached_wp, mock_response, tmp_path):
+        mock_get.return_value = mock_response(200, [{"name": "Tech", "slug": "tech", "id": 5}])
+        first = cached_wp()
+        assert first.get_categories()["Tech"] == 5
+        first.flush_disk_cache()
+        assert (tmp_path / "wp-poster" / "https-example-com.json").exists()
+
+        mock_get.reset_mock()
+        assert cached_wp().get_categories()["tech"] == 5
+        mock_get.assert_not_called()
+
+    @patch("wp_post.requests.get")
+    def test_expired_entries_refetched(self, mock_get, cached_wp, mock_response):
+        mock_get.return_value = mock_response(200, [{"name": "python", "slug": "python", "id": 3}])
+        first = cached_wp()
+        first.get_tags()
+        first.flush_disk_cache()
+        with patch("wp_post.time.time", return_value=wp_post.time.time() + wp_post._DISK_CACHE_TTL + 1):
+            cached_wp().get_tags()
+        assert mock_get.call_count == 2
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_created_terms_persisted(self, mock_get, mock_post, cached_wp, mock_response):
+        mock_get.return_value = mock_response(200, [])
+        mock_post.return_value = mock_response(201, {"id": 9, "slug": "new"})
+        first = cached_wp()
+        first.get_tags()
+        first.flush_disk_cache()
+        second = cached_wp()
+        second.get_tags()
+        second.create_tag("New")
+        second.flush_disk_cache()
+        assert cached_wp().get_tags() == {"New": 9, "new": 9}
+        assert mock_get.call_count == 1
+
+    @patch("wp_post.requests.get")
+    def test_refresh_ignores_and_rewrites(self, mock_get, cached_wp, mock_response):
+        mock_get.return_value = mock_response(200, [{"name": "Old", "slug": "old", "id": 1}])
+        first = cached_wp()
+        first.get_categories()
+        first.flush_disk_cache()
+
+        mock_get.return_value = mock_response(200, [{"name": "New", "slug": "new", "id": 2}])
+        with patch("wp_post.atexit.register"):
+            refreshed = WordPressPost("https://example.com", "user", "pass", disk_cache=True, refresh=True)
+        assert "New" in refreshed.get_categories()
+        refreshed.flush_disk_cache()
+        mock_get.reset_mock()
+        assert "New" in cached_wp().get_categories()
+        mock_get.assert_not_called()
+
+    @patch("wp_post.requests.get")
+    def test_disabled_by_default(self, mock_get, wp, mock_response, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        mock_get.return_value = mock_response(200, [])
+        wp.get_categories()
+        wp.flush_disk_cache()
+        assert not (tmp_path / "wp-poster").exists()
+
+    @patch("wp_post.requests.post")
+    def test_existing_term_id_recovered(self, mock_post, wp, mock_response):
+        mock_post.return_value = mock_response(400, {
+            "code": "term_exists", "data": {"status": 400, "term_id": 41},
+        })
+        assert wp.create_tag("stale") == 41
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_numeric_term_names_persisted(self, mock_get, mock_post, cached_wp, mock_response, tmp_path):
+        mock_get.return_value = mock_response(200, [{"name": "2024", "slug": "2024", "id": 4}])
+        mock_post.return_value = mock_response(201, {"id": 9, "slug": "2025"})
+        first = cached_wp()
+        first.get_tags()
+        first.create_tag(2025)
+        first.flush_disk_cache()
+        assert cached_wp().get_tags() == {"2024": 4, "2025": 9}
+        assert list((tmp_path / "wp-poster").iterdir()) == [tmp_path / "wp-poster" / "https-example-com.json"]
+
+    def test_failed_flush_leaves_no_temp_file(self, cached_wp, tmp_path):
+        wp = cached_wp()
+        wp._cache_put("tags", {"x": object()})
+        wp.flush_disk_cache()
+        assert list((tmp_path / "wp-poster").iterdir()) == []
+
+
+class TestMediaUploadStreaming:
+    @staticmethod
+    def _capture_upload(bodies, mock_response):
+        def upload(url, **kwargs):
+            bodies.append(kwargs["data"].read())
+            return mock_response(201, {"id": 3, "source_url": "https://example.com/x"})
+        return upload
+
+    @patch("wp_post.requests.post")
+    def test_file_body_is_streamed(self, mock_post, wp, mock_response, tmp_path):
+        img = tmp_path / "pic.png"
+        img.write_bytes(b"png-bytes")
+        bodies = []
+        mock_post.side_effect = self._capture_upload(bodies, mock_response)
+        assert wp.upload_media_from_file(str(img)) == (3, "https://example.com/x")
+        assert bodies == [b"png-bytes"]
+
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_url_download_spooled_then_streamed(self, mock_get, mock_post, wp, mock_response):
+        download = MagicMock(status_code=200, headers={"content-type": "image/png"})
+        download.iter_content.return_value = [b"chunk-1,", b"chunk-2"]
+        mock_get.return_value = download
+        bodies = []
+        mock_post.side_effect = self._capture_upload(bodies, mock_response)
+        assert wp.upload_media_from_url("https://img.example.com/a.png") == (3, "https://example.com/x")
+        assert mock_get.call_args[1]["stream"] is True
+        assert bodies == [b"chunk-1,chunk-2"]
+        assert mock_post.call_args[1]["headers"]["Content-Type"] == "image/png"
+
+    @pytest.mark.parametrize("name,content_type", [
+        ("a.JPG", "image/jpeg"),
+        ("a.avif", "image/avif"),
+        ("a.unknownext", "application/octet-stream"),
+    ])
+    @patch("wp_post.requests.post")
+    def test_file_content_type(self, mock_post, name, content_type, wp, mock_response, tmp_path):
+        img = tmp_path / name
+        img.write_bytes(b"x")
+        mock_post.return_value = mock_response(201, {"id": 3, "source_url": "https://example.com/x"})
+        wp.upload_media_from_file(str(img))
+        assert mock_post.call_args[1]["headers"]["Content-Type"] == content_type
+
+    @pytest.mark.parametrize("content_type,filename", [
+        ("image/png; charset=binary", "image.png"),
+        ("IMAGE/JPEG", "image.jpg"),
+        ("image/avif", "image.avif"),
+        ("text/html", "image.jpg"),
+    ])
+    @patch("wp_post.requests.post")
+    @patch("wp_post.requests.get")
+    def test_url_filename_from_mime(self, mock_get, mock_post, content_type, filename, wp, mock_response):
+        download = MagicMock(status_code=200, headers={"content-type": content_type})
+        download.iter_content.return_value = [b"x"]
+        mock_get.return_value = download
+        mock_post.return_value = mock_response(201, {"id": 3, "source_url": "https://example.com/x"})
+        wp.upload_media_from_url("https://picsum.example/400/300")
+        assert f'filename="{filename}"' in mock_post.call_args[1]["headers"]["Content-Disposition"]
@@ -9,94 +9,390 @@ warnings.filterwarnings("ignore", message="urllib3")
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 import argparse
+import atexit
+import functools
 import glob as glob_mod
 import json
+import mimetypes
 import os
 import re
 import subprocess
 import sys
+import tempfile
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import unquote
 import requests
-import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# yaml and gutenberg (mistune) are imported inside the functions that need
+# them so --help, --config-path and --ping don't pay their import cost.
 
 # Use a persistent session with a browser UA so Cloudflare WAF doesn't block REST API POST requests
 _session = requests.Session()
 _session.headers['User-Agent'] = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+# Pool sized for the parallel page/media fetches below. Idempotent requests
+# are retried on rate limiting and gateway errors with a short backoff;
+# Retry-After is ignored so a server can't stall the CLI for as long as it
+# likes. POSTs are never replayed, and the final error response is still
+# returned for the callers to report.
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 502, 503, 504),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    ),
+)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
 requests.get = _session.get
 requests.post = _session.post
 from datetime import datetime
 import getpass
 
-from gutenberg import GutenbergConverter
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj):
+    """Serialize obj to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _parse(response):
+    """Decode a REST response body, straight from bytes when orjson is available.
+
+    orjson only takes plain UTF-8, so bodies it rejects (a BOM prepended by
+    a plugin or theme, another charset) go through response.json(), which
+    detects the encoding, before anything is treated as malformed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except ValueError:
+            pass
+    return response.json()
+
+
+def _open_source(filepath):
+    """Open filepath for one sequential binary read.
+
+    Replaces the exists-check-then-reopen pattern: a missing file raises
+    FileNotFoundError here, and the kernel is told to read ahead.
+    """
+    fd = os.open(filepath, os.O_RDONLY)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return os.fdopen(fd, 'rb')
+
+
+def _decode_source(data):
+    """Decode file bytes the way text-mode open() would (UTF-8, universal newlines)."""
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _yaml_safe_load(text):
+    """yaml.safe_load, using the libyaml C loader when PyYAML was built with it."""
+    import yaml
+
+    return yaml.load(text, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def _frontmatter_end(content):
+    """Index of the closing --- fence, or -1 without a complete frontmatter block.
+
+    The frontmatter text is content[3:end] and the body content[end + 3:],
+    the same boundaries as content.split('---', 2) without building the list.
+    """
+    if not content.startswith('---'):
+        return -1
+    return content.find('---', 3)
+
+
+def _split_frontmatter(content):
+    """Split file text into (frontmatter dict, stripped body).
+
+    Files without a complete --- frontmatter block return ({}, content).
+    """
+    end = _frontmatter_end(content)
+    if end == -1:
+        return {}, content
+    return _yaml_safe_load(content[3:end]) or {}, content[end + 3:].strip()
+
+
+@functools.lru_cache(maxsize=256)
+def _read_and_split(path, mtime_ns, size):
+    """Read and split a file, memoized on (path, mtime, size).
+
+    Callers pass the file's current stat values, so editing the file (e.g.
+    the id/slug writeback) naturally misses the cache. The frontmatter is
+    returned as a read-only mapping because the entry is shared.
+    """
+    frontmatter, body = _split_frontmatter(_decode_source(Path(path).read_bytes()))
+    return types.MappingProxyType(frontmatter), body
+
+
+def _parse_file_cached(filepath):
+    """Return (frontmatter, body) for filepath via the _read_and_split cache."""
+    st = os.stat(filepath)
+    return _read_and_split(os.fspath(filepath), st.st_mtime_ns, st.st_size)
+
+
+def _total_pages(response):
+    """Page count from a WP REST collection response (1 if absent or invalid)."""
+    try:
+        return int(response.headers.get('X-WP-TotalPages', 1))
+    except (TypeError, ValueError):
+        return 1
+
+
+def _remember_term(cache, name, term):
+    """Add a newly created term to a name/slug -> id cache, if one is loaded."""
+    if cache is None:
+        return
+    # Frontmatter names can be numbers (tags: [2024]); the maps are keyed
+    # by str like the names WordPress returns, and must stay JSON-dumpable
+    cache[str(name)] = term['id']
+    if term.get('slug'):
+        cache[term['slug']] = term['id']
+
+
+# Strings safe to emit as plain (unquoted) YAML scalars, and plain words
+# YAML would read back as bool/null instead of str
+_PLAIN_SCALAR_RE = re.compile(r'[A-Za-z][A-Za-z0-9 _.,/()-]*')
+_YAML_RESERVED_WORDS = frozenset(('y', 'n', 'yes', 'no', 'on', 'off', 'true', 'false', 'null'))
+
+
+def _yaml_scalar(value):
+    """Format value as a plain YAML scalar, or return None if it needs yaml.dump."""
+    if value is None:
+        return 'null'
+    if value is True or value is False:
+        return 'true' if value else 'false'
+    if type(value) is int:
+        return str(value)
+    if (type(value) is str and len(value) < 70 and _PLAIN_SCALAR_RE.fullmatch(value)
+            and not value.endswith(' ') and value.lower() not in _YAML_RESERVED_WORDS):
+        return value
+    return None
+
+
+def _fast_yaml_dump_flat(data):
+    """Dump a flat frontmatter dict like yaml.dump(data, default_flow_style=False).
+
+    Handles the common case (plain str/int/bool/None values and lists of
+    them) by direct formatting; anything else falls back to yaml.dump.
+    """
+    lines = []
+    for key in sorted(data, key=str):
+        name = _yaml_scalar(key) if type(key) is str else None
+        value = data[key]
+        if type(value) is list:
+            items = [_yaml_scalar(v) for v in value]
+            if name is None or None in items:
+                break
+            if items:
+                lines.append(f"{name}:\n")
+                lines.extend(f"- {item}\n" for item in items)
+            else:
+                lines.append(f"{name}: []\n")
+            continue
+        scalar = _yaml_scalar(value)
+        # yaml.dump folds plain scalars on lines past 80 columns
+        if name is None or scalar is None or len(name) + len(scalar) + 2 > 80:
+            break
+        lines.append(f"{name}: {scalar}\n")
+    else:
+        if lines:
+            return ''.join(lines)
+
+    import yaml
+    return yaml.dump(dict(data), default_flow_style=False)
+
+
+# Config keys that must be present (from any source) before posting
+_REQUIRED = frozenset(('site_url', 'username', 'app_password'))
+
+# Prefixes that mark a media or site reference as remote rather than a local path
+_URL_SCHEMES = ('http://', 'https://')
+
+# Runs of characters that slug sanitization collapses to a hyphen
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Section divider for --init and --test output
+_RULE = '=' * 40
+
+# WordPress rejects batch/v1 requests with more sub-requests than this by default
+_BATCH_MAX_REQUESTS = 25
+
+# Upload Content-Type by source file extension; mimetypes covers the rest
+_EXT_TO_MIME = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
+
+# Filename extension for a downloaded image without one, by its MIME type
+_MIME_TO_EXT = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/pjpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+}
+
+# Read size when spooling a remote media download to disk
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Seconds a lookup persisted by the disk cache stays usable (see WordPressPost)
+_DISK_CACHE_TTL = 600
+
+
+def _disk_cache_path(site_url):
+    """Per-site lookup cache file under $XDG_CACHE_HOME (default ~/.cache)."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    name = _SLUG_RE.sub('-', site_url.lower()).strip('-')
+    return os.path.join(base, 'wp-poster', f"{name}.json")
+
+# Shown when required config is missing
+_EXAMPLE_CONFIG_JSON = """{
+  "site_url": "https://your-site.com",
+  "username": "your-username",
+  "app_password": "your-app-password"
+}"""
+
+
+def _local_image_path(src):
+    """Return the existing local file an image source names, or None.
+
+    mistune percent-encodes non-ASCII characters in link targets, so
+    ![](héllo.png) arrives as h%C3%A9llo.png; try the decoded form too.
+    """
+    if os.path.exists(src):
+        return src
+    decoded = unquote(src)
+    if decoded != src and os.path.exists(decoded):
+        return decoded
+    return None
 
 
 class WordPressPost:
-    def __init__(self, site_url, username, app_password):
+    def __init__(self, site_url, username, app_password, disk_cache=False, refresh=False):
+        """disk_cache persists category, tag, taxonomy-term, rest_base and
+        user lookups per site for _DISK_CACHE_TTL seconds, so consecutive
+        runs (one file each) skip re-fetching them. main() enables it.
+        refresh ignores what is on disk, fetching everything anew and
+        replacing the cache with the results.
+        """
         self.site_url = site_url.rstrip('/')
         self.auth = (username, app_password)
         self.api_url = f"{self.site_url}/wp-json/wp/v2"
         self._media_source_cache = {}  # source path/URL -> (media_id, wp_source_url)
+        self._image_url_cache = {}  # source path/URL -> process_image_url result, failures included
         self._current_article_scope = None  # set by post_to_wordpress for the duration of a publish
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'})
+        self._converter = None  # GutenbergConverter, built on first markdown conversion
+        self._cat_cache = None  # name/slug -> id, filled by the first get_categories()
+        self._tag_cache = None  # name/slug -> id, filled by the first get_tags()
+        self._taxonomy_cache = {}  # taxonomy slug -> REST base
+        self._terms_cache = {}  # custom taxonomy REST base -> name/slug -> id
+        self._user_cache = {}  # username/display name/slug -> user id
+        self._batch_supported = None  # whether batch/v1 exists, probed on first multi-term create
+        # Cross-run lookup cache: key -> [fetched_at, value], written back at exit
+        self._disk_cache_path = _disk_cache_path(self.site_url) if disk_cache else None
+        self._disk_cache = self._load_disk_cache() if disk_cache and not refresh else {}
+        self._disk_cache_dirty = bool(disk_cache and refresh)
+        if disk_cache:
+            atexit.register(self.flush_disk_cache)
+        # All REST calls go through requests.get/post, which are bound to the
+        # module-level _session; expose that same pooled session here rather
+        # than opening a second one that nothing uses.
+        self.session = _session
         
     def parse_frontmatter_only(self, filepath):
         """Parse just the frontmatter without processing content"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                return yaml.safe_load(parts[1]) or {}
-        return {}
+        return _parse_file_cached(filepath)[0]
 
     def parse_markdown_file(self, filepath):
         """Parse markdown file with frontmatter and convert to Gutenberg blocks"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Split frontmatter and content
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                frontmatter = yaml.safe_load(parts[1])
-                markdown_content = parts[2].strip()
-            else:
-                frontmatter = {}
-                markdown_content = content
-        else:
-            frontmatter = {}
-            markdown_content = content
+        frontmatter, markdown_content = self.parse_raw_file(filepath)
+        return frontmatter, self.convert_markdown(markdown_content)
+
+    def convert_markdown(self, markdown_content):
+        """Convert markdown to Gutenberg blocks, uploading inline images"""
+        if self._converter is None:
+            from gutenberg import GutenbergConverter
+            self._converter = GutenbergConverter(
+                image_handler=self._handle_image,
+                image_prefetcher=self._prefetch_images,
+            )
+        return self._converter.convert(markdown_content)
 
-        # Convert markdown to Gutenberg blocks using image handler
-        converter = GutenbergConverter(image_handler=self._handle_image)
-        blocks_content = converter.convert(markdown_content)
+    def _prefetch_images(self, sources):
+        """Upload the document's images in parallel before it is rendered.
 
-        return frontmatter, blocks_content
+        Called by the converter with the exact sources it will hand to
+        _handle_image (parsed, so images in code are excluded). The renderer
+        resolves images one at a time as it walks the document; resolving
+        them up front fills _image_url_cache so those lookups become cache
+        hits instead of serial round-trips. Missing local files are left
+        for the renderer's own process_image_url call to report.
+        """
+        pending = [
+            src for src in sources
+            if src not in self._image_url_cache
+            and (src.startswith(_URL_SCHEMES) or _local_image_path(src))
+        ]
+        if len(pending) < 2:
+            return
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(self.process_image_url, pending))
 
     def _handle_image(self, image_url):
         """Image handler callback for the markdown converter."""
         return self.process_image_url(image_url)
 
     def parse_raw_file(self, filepath):
-        """Parse file with frontmatter but keep content as-is (no markdown conversion)"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Split frontmatter and content
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                frontmatter = yaml.safe_load(parts[1])
-                raw_content = parts[2].strip()
-            else:
-                frontmatter = {}
-                raw_content = content
-        else:
-            frontmatter = {}
-            raw_content = content
+        """Parse file with frontmatter but keep content as-is (no markdown conversion).
 
-        return frontmatter, raw_content
+        filepath may also be a binary file object already opened by the
+        caller (see _open_source), in which case it is read but not closed.
+        Paths go through a per-process cache keyed on mtime, so repeat
+        parses of an unchanged file skip the read and YAML load; the
+        frontmatter is then a read-only mapping.
+        """
+        if hasattr(filepath, 'read'):
+            return _split_frontmatter(_decode_source(filepath.read()))
+        return _parse_file_cached(filepath)
 
     def process_image_url(self, image_path_or_url):
         """Process image URL - upload (or reuse existing) and return (final_url, media_id).
@@ -104,16 +400,28 @@ class WordPressPost:
         For remote URLs that fail to upload, falls back to (original_url, None) so the
         post can still render with the source URL. For missing local files, returns
         (None, None), which signals the markdown converter to drop the image.
-        """
-        is_url = image_path_or_url.startswith(('http://', 'https://'))
 
-        if not is_url and not os.path.exists(image_path_or_url):
+        Results, including failures, are remembered per source for the life of
+        this instance, so an image referenced several times is resolved once.
+        """
+        result = self._image_url_cache.get(image_path_or_url)
+        if result is None:
+            result = self._resolve_image_url(image_path_or_url)
+            self._image_url_cache[image_path_or_url] = result
+        return result
+
+    def _resolve_image_url(self, image_path_or_url):
+        """Uncached body of process_image_url."""
+        is_url = image_path_or_url.startswith(_URL_SCHEMES)
+
+        source = image_path_or_url if is_url else _local_image_path(image_path_or_url)
+        if source is None:
             print(f"✗ Inline image file not found: {image_path_or_url}")
             return (None, None)
 
-        media_id = self.upload_media(image_path_or_url)
+        media_id = self.upload_media(source)
         if media_id:
-            cached = self._media_source_cache.get(image_path_or_url)
+            cached = self._media_source_cache.get(source)
             if cached:
                 _, source_url = cached
                 return (source_url, media_id)
@@ -124,66 +432,192 @@ class WordPressPost:
         print(f"✗ Failed to upload inline image: {image_path_or_url}")
         return (None, None)
 
+    def _fetch_term_map(self, rest_base):
+        """GET every page of a term collection, indexed by both name and slug.
+
+        WordPress caps per_page at 100, so larger taxonomies span several
+        pages. The first response's X-WP-TotalPages header tells how many;
+        the remaining pages are fetched concurrently over the shared session.
+        Returns None if the first page fails.
+        """
+        url = f"{self.api_url}/{rest_base}"
+        # Only the fields the map needs, not descriptions, counts and links
+        params = {'per_page': 100, '_fields': 'id,name,slug'}
+        response = requests.get(url, auth=self.auth, params=params, timeout=30)
+        if response.status_code != 200:
+            return None
+        pages = [_parse(response)]
+
+        total_pages = _total_pages(response)
+        if total_pages > 1:
+            def _fetch_page(page):
+                resp = requests.get(url, auth=self.auth, params={**params, 'page': page}, timeout=30)
+                return _parse(resp) if resp.status_code == 200 else []
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                pages.extend(pool.map(_fetch_page, range(2, total_pages + 1)))
+
+        terms = {}
+        for page in pages:
+            for term in page:
+                terms[term['name']] = term['id']
+                terms[term['slug']] = term['id']
+        return terms
+
+    def _load_disk_cache(self):
+        """Read the cross-run lookup cache; a missing or corrupt file is empty."""
+        try:
+            with open(self._disk_cache_path, 'rb') as f:
+                data = _loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _cache_get(self, key):
+        """Return the disk-cached value for key if it is still fresh, else None."""
+        entry = self._disk_cache.get(key)
+        if (isinstance(entry, list) and len(entry) == 2
+                and isinstance(entry[0], (int, float))
+                and time.time() - entry[0] < _DISK_CACHE_TTL):
+            return entry[1]
+        return None
+
+    def _cache_put(self, key, value):
+        """Record a freshly fetched lookup for the disk cache, if enabled."""
+        if self._disk_cache_path is not None:
+            self._disk_cache[key] = [time.time(), value]
+            self._disk_cache_dirty = True
+
+    def flush_disk_cache(self):
+        """Write changed lookups back to the disk cache, dropping expired ones.
+
+        Registered with atexit when the cache is enabled. The cache is an
+        optimization only, so write failures are ignored.
+        """
+        if self._disk_cache_path is None or not self._disk_cache_dirty:
+            return
+        fresh = {key: entry for key, entry in self._disk_cache.items() if self._cache_get(key) is not None}
+        tmp_path = f"{self._disk_cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._disk_cache_path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(_dumps(fresh))
+            os.replace(tmp_path, self._disk_cache_path)
+            self._disk_cache_dirty = False
+        except (OSError, TypeError, ValueError):
+            pass
+        finally:
+            # Gone after a successful replace; otherwise don't leave it behind
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
     def get_categories(self):
-        """Get all categories from WordPress, indexed by both name and slug"""
-        response = requests.get(
-            f"{self.api_url}/categories",
-            auth=self.auth,
-            params={'per_page': 100},
-            timeout=30
-        )
-        if response.status_code == 200:
-            cats = {}
-            for cat in response.json():
-                cats[cat['name']] = cat['id']
-                cats[cat['slug']] = cat['id']
-            return cats
-        return {}
+        """Get all categories from WordPress, indexed by both name and slug.
+
+        Fetched once per instance (or taken from the disk cache);
+        create_category() keeps the cached map current so later lookups
+        don't need another GET.
+        """
+        if self._cat_cache is not None:
+            return self._cat_cache
+        cats = self._cache_get('categories')
+        if cats is None:
+            cats = self._fetch_term_map('categories')
+            if cats is None:
+                return {}
+            self._cache_put('categories', cats)
+        self._cat_cache = cats
+        return cats
 
     def get_tags(self):
-        """Get all tags from WordPress, indexed by both name and slug"""
-        response = requests.get(
-            f"{self.api_url}/tags",
-            auth=self.auth,
-            params={'per_page': 100},
-            timeout=30
-        )
-        if response.status_code == 200:
-            tags = {}
-            for tag in response.json():
-                tags[tag['name']] = tag['id']
-                tags[tag['slug']] = tag['id']
-            return tags
-        return {}
-    
-    def create_category(self, name):
-        """Create a new category"""
+        """Get all tags from WordPress, indexed by both name and slug.
+
+        Fetched once per instance (or taken from the disk cache);
+        create_tag() keeps the cached map current.
+        """
+        if self._tag_cache is not None:
+            return self._tag_cache
+        tags = self._cache_get('tags')
+        if tags is None:
+            tags = self._fetch_term_map('tags')
+            if tags is None:
+                return {}
+            self._cache_put('tags', tags)
+        self._tag_cache = tags
+        return tags
+
+    def invalidate_taxonomy_cache(self):
+        """Drop cached categories, tags and taxonomy terms so the next lookup refetches them."""
+        self._cat_cache = None
+        self._tag_cache = None
+        self._terms_cache.clear()
+        for key in [k for k in self._disk_cache if k in ('categories', 'tags') or k.startswith('terms:')]:
+            del self._disk_cache[key]
+            self._disk_cache_dirty = True
+
+    def _term_cache(self, rest_base):
+        """The loaded name/slug -> id map for rest_base, or None."""
+        if rest_base == 'categories':
+            return self._cat_cache
+        if rest_base == 'tags':
+            return self._tag_cache
+        return self._terms_cache.get(rest_base)
+
+    def _remember_created(self, rest_base, name, term):
+        """Add a created term to the loaded map for rest_base (and so the disk cache)."""
+        cache = self._term_cache(rest_base)
+        _remember_term(cache, name, term)
+        if cache is not None and self._disk_cache_path is not None:
+            self._disk_cache_dirty = True
+
+    def _create_term(self, rest_base, name):
+        """Create a term in the collection at rest_base, returning its ID or None."""
         data = {'name': name}
-        response = requests.post(f"{self.api_url}/categories", auth=self.auth, json=data, timeout=30)
+        response = requests.post(f"{self.api_url}/{rest_base}", auth=self.auth, json=data, timeout=30)
         if response.status_code == 201:
-            return response.json()['id']
+            term = _parse(response)
+            self._remember_created(rest_base, name, term)
+            return term['id']
+        # The term exists but wasn't in our (possibly disk-cached) map;
+        # WordPress reports its ID alongside the error.
+        if response.status_code == 400:
+            try:
+                error = _parse(response)
+            except ValueError:
+                return None
+            if isinstance(error, dict) and error.get('code') == 'term_exists':
+                term_id = (error.get('data') or {}).get('term_id')
+                if isinstance(term_id, int):
+                    self._remember_created(rest_base, name, {'id': term_id})
+                    return term_id
         return None
-    
+
+    def create_category(self, name):
+        """Create a new category"""
+        return self._create_term('categories', name)
+
     def create_tag(self, name):
         """Create a new tag"""
-        data = {'name': name}
-        response = requests.post(f"{self.api_url}/tags", auth=self.auth, json=data, timeout=30)
-        if response.status_code == 201:
-            return response.json()['id']
-        return None
-    
+        return self._create_term('tags', name)
+
     def get_taxonomy_rest_base(self, taxonomy):
         """Get the REST API base for a taxonomy (may differ from slug)"""
-        if not hasattr(self, '_taxonomy_cache'):
-            self._taxonomy_cache = {}
         if taxonomy in self._taxonomy_cache:
             return self._taxonomy_cache[taxonomy]
 
+        rest_base = self._cache_get(f'rest_base:{taxonomy}')
+        if rest_base is not None:
+            self._taxonomy_cache[taxonomy] = rest_base
+            return rest_base
+
         # Query WordPress for taxonomy info
         response = requests.get(f"{self.api_url}/taxonomies/{taxonomy}", auth=self.auth, timeout=30)
         if response.status_code == 200:
-            rest_base = response.json().get('rest_base', taxonomy)
+            rest_base = _parse(response).get('rest_base', taxonomy)
             self._taxonomy_cache[taxonomy] = rest_base
+            self._cache_put(f'rest_base:{taxonomy}', rest_base)
             return rest_base
 
         # Fallback to slug if taxonomy not found
@@ -191,66 +625,135 @@ class WordPressPost:
         return taxonomy
 
     def get_taxonomy_terms(self, taxonomy):
-        """Get all terms for a taxonomy, indexed by both name and slug"""
+        """Get all terms for a taxonomy, indexed by both name and slug.
+
+        Fetched once per instance like get_categories(); created terms are
+        added to the cached map in place.
+        """
         rest_base = self.get_taxonomy_rest_base(taxonomy)
-        response = requests.get(
-            f"{self.api_url}/{rest_base}",
-            auth=self.auth,
-            params={'per_page': 100},
-            timeout=30
-        )
-        if response.status_code == 200:
-            terms = {}
-            for term in response.json():
-                terms[term['name']] = term['id']
-                terms[term['slug']] = term['id']
+        terms = self._terms_cache.get(rest_base)
+        if terms is not None:
             return terms
-        return {}
+        terms = self._cache_get(f'terms:{rest_base}')
+        if terms is None:
+            terms = self._fetch_term_map(rest_base)
+            if terms is None:
+                return {}
+            self._cache_put(f'terms:{rest_base}', terms)
+        self._terms_cache[rest_base] = terms
+        return terms
+
+    def _lookup_taxonomy(self, taxonomy):
+        """Return (rest_base, existing name/slug -> id) for a custom taxonomy."""
+        return self.get_taxonomy_rest_base(taxonomy), self.get_taxonomy_terms(taxonomy)
 
     def create_taxonomy_term(self, taxonomy, name):
         """Create a new term in a taxonomy"""
-        rest_base = self.get_taxonomy_rest_base(taxonomy)
-        data = {'name': name}
-        response = requests.post(f"{self.api_url}/{rest_base}", auth=self.auth, json=data, timeout=30)
-        if response.status_code == 201:
-            return response.json()['id']
-        return None
+        return self._create_term(self.get_taxonomy_rest_base(taxonomy), name)
+
+    def _batch_available(self):
+        """Whether the site exposes the batch/v1 endpoint (WordPress 5.6+).
+
+        Probed once per instance from the REST index's namespace list.
+        """
+        if self._batch_supported is None:
+            response = requests.get(
+                f"{self.site_url}/wp-json/",
+                auth=self.auth,
+                params={'_fields': 'namespaces'},
+                timeout=30,
+            )
+            try:
+                namespaces = _parse(response).get('namespaces') if response.status_code == 200 else None
+            except ValueError:
+                namespaces = None
+            self._batch_supported = isinstance(namespaces, list) and 'batch/v1' in namespaces
+        return self._batch_supported
+
+    def _batch_create_terms(self, pending):
+        """Create up to _BATCH_MAX_REQUESTS terms in one batch/v1 request.
+
+        pending is a list of (rest_base, name). Returns {(rest_base, name): id}
+        for the terms the batch created; anything missing is left to the caller.
+        """
+        payload = {'requests': [
+            {'method': 'POST', 'path': f'/wp/v2/{rest_base}', 'body': {'name': name}}
+            for rest_base, name in pending
+        ]}
+        response = requests.post(f"{self.site_url}/wp-json/batch/v1", auth=self.auth, json=payload, timeout=30)
+        if response.status_code not in (200, 207):
+            return {}
+        created = {}
+        for (rest_base, name), result in zip(pending, _parse(response).get('responses', [])):
+            term = result.get('body')
+            if result.get('status') == 201 and isinstance(term, dict) and 'id' in term:
+                self._remember_created(rest_base, name, term)
+                created[(rest_base, name)] = term['id']
+        return created
+
+    def _create_terms(self, pending):
+        """Create every (rest_base, name) in pending, returning {(rest_base, name): id or None}.
+
+        Two or more new terms go out as batch/v1 requests when the site
+        supports them, saving a round-trip per term. Terms the batch didn't
+        create (or all of them, on older sites) fall back to one POST each.
+        """
+        created = {}
+        if len(pending) > 1 and self._batch_available():
+            for start in range(0, len(pending), _BATCH_MAX_REQUESTS):
+                created.update(self._batch_create_terms(pending[start:start + _BATCH_MAX_REQUESTS]))
+        for rest_base, name in pending:
+            if (rest_base, name) not in created:
+                created[(rest_base, name)] = self._create_term(rest_base, name)
+        return created
 
     def get_user_id(self, username_or_id):
         """Get user ID from username or return ID if already numeric"""
-        # If it's already a number, return it
-        if isinstance(username_or_id, int):
+        # If it's already a number, return it (exact type check, so bools
+        # aren't taken for IDs)
+        if type(username_or_id) is int:
             return username_or_id
-        if isinstance(username_or_id, str) and username_or_id.isdigit():
+        if type(username_or_id) is str and username_or_id.isdigit():
             return int(username_or_id)
 
+        if username_or_id in self._user_cache:
+            return self._user_cache[username_or_id]
+        cached = self._cache_get(f'user:{username_or_id}')
+        if cached is not None:
+            self._user_cache[username_or_id] = cached
+            return cached
+
         # Look up by username
         response = requests.get(
             f"{self.api_url}/users",
             auth=self.auth,
-            params={'search': username_or_id},
+            params={'search': username_or_id, '_fields': 'id,name,slug'},
             timeout=30
         )
         if response.status_code == 200:
-            users = response.json()
+            users = _parse(response)
             for user in users:
                 if user.get('slug') == username_or_id or user.get('name') == username_or_id:
+                    # Remember the slug too, so slug and display name share one lookup
+                    for key in dict.fromkeys((username_or_id, user.get('slug'))):
+                        if key:
+                            self._user_cache[key] = user['id']
+                            self._cache_put(f'user:{key}', user['id'])
                     return user['id']
         return None
 
     def _writeback_frontmatter(self, filepath, post_id, post_url):
         """Write id and slug back into the file's frontmatter after a successful create."""
+        import yaml
+
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        if not content.startswith('---'):
+        end = _frontmatter_end(content)
+        if end == -1:
             return
 
-        parts = content.split('---', 2)
-        if len(parts) < 3:
-            return
-
-        fm = yaml.safe_load(parts[1]) or {}
+        fm = _yaml_safe_load(content[3:end]) or {}
         fm['id'] = post_id
 
         # Extract slug from URL: last non-empty path segment
@@ -262,7 +765,7 @@ class WordPressPost:
                 fm['slug'] = resolved_slug
 
         new_frontmatter = yaml.dump(fm, default_flow_style=False, allow_unicode=True).rstrip()
-        body = parts[2]
+        body = content[end + 3:]
         new_content = f"---\n{new_frontmatter}\n---{body}"
 
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -324,9 +827,14 @@ class WordPressPost:
         write_msls_links(wp_cli_alias, current_post, siblings)
         print(f"✓ MSLS translation links written ({len(siblings) + 1} members)")
 
-    def post_to_wordpress(self, filepath, draft=False, raw=False, author_context=None, verbose=False):
+    def post_to_wordpress(self, filepath, draft=False, raw=False, author_context=None, verbose=False,
+                          pre_parsed=None):
         """Post file to WordPress.
 
+        pre_parsed, when given, is the (frontmatter, content) tuple already
+        returned by parse_raw_file for filepath, so the file isn't read and
+        parsed a second time.
+
         Sets the per-publish article scope so all media uploaded for this
         article (featured image and inline images) are namespaced in the WP
         media library, preventing cross-article filename collisions in dedup
@@ -335,17 +843,21 @@ class WordPressPost:
         """
         self._current_article_scope = self._article_scope_for(filepath)
         try:
-            return self._do_post_to_wordpress(filepath, draft, raw, author_context, verbose)
+            return self._do_post_to_wordpress(filepath, draft, raw, author_context, verbose, pre_parsed)
         finally:
             self._current_article_scope = None
 
-    def _do_post_to_wordpress(self, filepath, draft, raw, author_context, verbose):
-        if raw:
+    def _do_post_to_wordpress(self, filepath, draft, raw, author_context, verbose, pre_parsed=None):
+        if pre_parsed is not None:
+            frontmatter, content = pre_parsed
+        else:
             frontmatter, content = self.parse_raw_file(filepath)
+
+        if raw:
             if verbose:
                 print(f"[verbose] Parsed raw file: {filepath}")
         else:
-            frontmatter, content = self.parse_markdown_file(filepath)
+            content = self.convert_markdown(content)
             if verbose:
                 print(f"[verbose] Parsed and converted markdown: {filepath}")
         
@@ -394,45 +906,59 @@ class WordPressPost:
         if 'parent' in frontmatter:
             post_data['parent'] = frontmatter['parent']
 
-        # Handle author (frontmatter overrides config)
+        # Author (frontmatter overrides config), existing terms and the
+        # featured image don't depend on each other, so look them all up
+        # concurrently over the shared session.
         author = frontmatter.get('author', author_context)
-        if author:
-            author_id = self.get_user_id(author)
+        taxonomies = frontmatter.get('taxonomies', {})
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            author_future = pool.submit(self.get_user_id, author) if author else None
+            # (post_data key, names, future of (rest_base, existing name/slug -> id));
+            # categories and tags only apply to posts
+            term_lookups = []
+            if 'categories' in frontmatter and api_endpoint == 'posts':
+                term_lookups.append(('categories', frontmatter['categories'],
+                                     pool.submit(lambda: ('categories', self.get_categories()))))
+            if 'tags' in frontmatter and api_endpoint == 'posts':
+                term_lookups.append(('tags', frontmatter['tags'],
+                                     pool.submit(lambda: ('tags', self.get_tags()))))
+            for taxonomy, terms in taxonomies.items():
+                # Ensure terms is a list
+                if isinstance(terms, str):
+                    terms = [terms]
+                term_lookups.append((taxonomy, terms, pool.submit(self._lookup_taxonomy, taxonomy)))
+            media_future = (
+                pool.submit(self.upload_media, frontmatter['featured_image'])
+                if 'featured_image' in frontmatter else None
+            )
+
+        if author_future is not None:
+            author_id = author_future.result()
             if author_id:
                 post_data['author'] = author_id
             else:
                 print(f"⚠ Author '{author}' not found, using authenticated user")
 
-        # Handle categories (only for posts)
-        if 'categories' in frontmatter and api_endpoint == 'posts':
-            existing_cats = self.get_categories()
-            cat_ids = []
-            for cat_name in frontmatter['categories']:
-                if cat_name in existing_cats:
-                    cat_ids.append(existing_cats[cat_name])
-                else:
-                    # Create new category
-                    new_id = self.create_category(cat_name)
-                    if new_id:
-                        cat_ids.append(new_id)
-            if cat_ids:
-                post_data['categories'] = cat_ids
-        
-        # Handle tags (only for posts)
-        if 'tags' in frontmatter and api_endpoint == 'posts':
-            existing_tags = self.get_tags()
-            tag_ids = []
-            for tag_name in frontmatter['tags']:
-                if tag_name in existing_tags:
-                    tag_ids.append(existing_tags[tag_name])
-                else:
-                    # Create new tag
-                    new_id = self.create_tag(tag_name)
-                    if new_id:
-                        tag_ids.append(new_id)
-            if tag_ids:
-                post_data['tags'] = tag_ids
-        
+        term_fields = []  # (post_data key, rest_base, unique names, existing)
+        for key, names, future in term_lookups:
+            rest_base, existing = future.result()
+            term_fields.append((key, rest_base, list(dict.fromkeys(map(str, names))), existing))
+
+        # Create all missing terms together, then resolve names to IDs in order
+        missing = dict.fromkeys(
+            (rest_base, name)
+            for _, rest_base, names, existing in term_fields
+            for name in names
+            if name not in existing
+        )
+        created = self._create_terms(list(missing)) if missing else {}
+        for key, rest_base, names, existing in term_fields:
+            ids = [existing[name] if name in existing else created[(rest_base, name)] for name in names]
+            # A name and its slug can both be listed; send each ID once
+            ids = list(dict.fromkeys(term_id for term_id in ids if term_id))
+            if ids:
+                post_data[key] = ids
+
         # Handle custom fields/meta
         if 'meta' in frontmatter:
             post_data['meta'] = frontmatter['meta']
@@ -441,32 +967,9 @@ class WordPressPost:
         if 'acf' in frontmatter:
             post_data['acf'] = frontmatter['acf']
         
-        # Handle custom taxonomies
-        if 'taxonomies' in frontmatter:
-            for taxonomy, terms in frontmatter['taxonomies'].items():
-                # Ensure terms is a list
-                if isinstance(terms, str):
-                    terms = [terms]
-                
-                # Get existing terms for this taxonomy
-                existing_terms = self.get_taxonomy_terms(taxonomy)
-                term_ids = []
-                
-                for term_name in terms:
-                    if term_name in existing_terms:
-                        term_ids.append(existing_terms[term_name])
-                    else:
-                        # Create new term
-                        new_id = self.create_taxonomy_term(taxonomy, term_name)
-                        if new_id:
-                            term_ids.append(new_id)
-                
-                if term_ids:
-                    post_data[taxonomy] = term_ids
-        
         # Handle featured image
-        if 'featured_image' in frontmatter:
-            media_id = self.upload_media(frontmatter['featured_image'])
+        if media_future is not None:
+            media_id = media_future.result()
             if media_id:
                 post_data['featured_media'] = media_id
         
@@ -493,7 +996,7 @@ class WordPressPost:
             print(f"[verbose] Response: {response.status_code}")
         
         if response.status_code in [200, 201]:
-            post = response.json()
+            post = _parse(response)
             post_id = post['id']
 
             # Handle Rank Math SEO meta via dedicated API
@@ -513,14 +1016,20 @@ class WordPressPost:
                 'title': post['title']['rendered']
             }
         else:
+            # A cached term or user ID may have gone stale on the server;
+            # make the next run look everything up again.
+            if self._disk_cache:
+                self._disk_cache.clear()
+                self._disk_cache_dirty = True
             error_msg = response.text
-            # Check for author permission error
+            # Check for author permission error, parsing the text already
+            # decoded above rather than decoding the body again via .json()
             try:
-                error_data = response.json()
-                if error_data.get('code') == 'rest_cannot_edit_others':
-                    error_msg = f"Permission denied: cannot set author to another user. {error_data.get('message', '')}"
-            except (ValueError, KeyError):
-                pass
+                error_data = _loads(error_msg)
+            except ValueError:
+                error_data = None
+            if isinstance(error_data, dict) and error_data.get('code') == 'rest_cannot_edit_others':
+                error_msg = f"Permission denied: cannot set author to another user. {error_data.get('message', '')}"
             return {
                 'success': False,
                 'error': error_msg,
@@ -596,7 +1105,7 @@ class WordPressPost:
             scope_raw = parent_dir
         else:
             scope_raw = os.path.splitext(os.path.basename(abs_path))[0]
-        scope = re.sub(r'[^a-z0-9]+', '-', scope_raw.lower()).strip('-')
+        scope = _SLUG_RE.sub('-', scope_raw.lower()).strip('-')
         return scope or None
 
     def find_existing_media(self, filename):
@@ -608,7 +1117,7 @@ class WordPressPost:
         across different file extensions are not treated as matches.
         """
         base = os.path.splitext(filename)[0]
-        slug_base = re.sub(r'[^a-z0-9]+', '-', base.lower()).strip('-')
+        slug_base = _SLUG_RE.sub('-', base.lower()).strip('-')
         if not slug_base:
             return None
         try:
@@ -620,7 +1129,7 @@ class WordPressPost:
             )
             if response.status_code != 200:
                 return None
-            for item in response.json():
+            for item in _parse(response):
                 source_url = item.get('source_url', '')
                 if source_url.rsplit('/', 1)[-1].lower() == filename.lower():
                     return (item['id'], source_url)
@@ -651,7 +1160,7 @@ class WordPressPost:
         if cached:
             return cached[0]
 
-        if filepath_or_url.startswith(('http://', 'https://')):
+        if filepath_or_url.startswith(_URL_SCHEMES):
             original_filename = os.path.basename(filepath_or_url.split('?')[0])
         else:
             original_filename = os.path.basename(filepath_or_url)
@@ -673,7 +1182,7 @@ class WordPressPost:
                 self._media_source_cache[filepath_or_url] = (media_id, source_url)
                 return media_id
 
-        if filepath_or_url.startswith(('http://', 'https://')):
+        if filepath_or_url.startswith(_URL_SCHEMES):
             result = self.upload_media_from_url(filepath_or_url, target_filename=target_filename or None)
         else:
             result = self.upload_media_from_file(filepath_or_url, target_filename=target_filename or None)
@@ -689,62 +1198,62 @@ class WordPressPost:
 
         target_filename, when provided, overrides the URL-derived filename
         (used by upload_media to apply article-scope prefixing).
-        """
-        try:
-            print(f"Downloading featured image from URL: {url}")
 
-            # Download the image
-            response = requests.get(url, timeout=30)
-            if response.status_code != 200:
-                print(f"✗ Failed to download image from URL: {response.status_code}")
+        The download is spooled in chunks to an anonymous temporary file and
+        the upload streams from it, so large media is never held in memory.
+        """
+        with tempfile.TemporaryFile() as spool:
+            try:
+                print(f"Downloading featured image from URL: {url}")
+
+                # Download the image
+                response = requests.get(url, timeout=30, stream=True)
+                with response:
+                    if response.status_code != 200:
+                        print(f"✗ Failed to download image from URL: {response.status_code}")
+                        return None
+                    for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                        spool.write(chunk)
+                spool.seek(0)
+
+                # Get filename from URL or generate one
+                filename = os.path.basename(url.split('?')[0])  # Remove query params
+                if not filename or '.' not in filename:
+                    # Generate filename based on content type (default .jpg)
+                    mime = response.headers.get('content-type', '').split(';')[0].strip().lower()
+                    ext = _MIME_TO_EXT.get(mime)
+                    if ext is None and mime.startswith('image/'):
+                        ext = mimetypes.guess_extension(mime)
+                    filename = f"image{ext or '.jpg'}"
+
+                # Article-scope override - upload_media has already prepended the scope
+                if target_filename:
+                    filename = target_filename
+
+                # Get content type
+                content_type = response.headers.get('content-type', 'application/octet-stream')
+
+            except requests.exceptions.RequestException as e:
+                print(f"✗ Error downloading image from URL: {e}")
                 return None
 
-            media_data = response.content
-
-            # Get filename from URL or generate one
-            filename = os.path.basename(url.split('?')[0])  # Remove query params
-            if not filename or '.' not in filename:
-                # Generate filename based on content type
-                content_type = response.headers.get('content-type', '').lower()
-                if 'jpeg' in content_type or 'jpg' in content_type:
-                    filename = 'image.jpg'
-                elif 'png' in content_type:
-                    filename = 'image.png'
-                elif 'gif' in content_type:
-                    filename = 'image.gif'
-                elif 'webp' in content_type:
-                    filename = 'image.webp'
-                else:
-                    filename = 'image.jpg'  # Default
-
-            # Article-scope override - upload_media has already prepended the scope
-            if target_filename:
-                filename = target_filename
-
-            # Get content type
-            content_type = response.headers.get('content-type', 'application/octet-stream')
-
-        except requests.exceptions.RequestException as e:
-            print(f"✗ Error downloading image from URL: {e}")
-            return None
+            headers = {
+                'Content-Disposition': f'attachment; filename="{filename}"',
+                'Content-Type': content_type
+            }
 
-        headers = {
-            'Content-Disposition': f'attachment; filename="{filename}"',
-            'Content-Type': content_type
-        }
-        
-        print(f"Uploading featured image: {filename}")
+            print(f"Uploading featured image: {filename}")
+
+            upload_response = requests.post(
+                f"{self.api_url}/media",
+                auth=self.auth,
+                headers=headers,
+                data=spool,
+                timeout=60
+            )
 
-        upload_response = requests.post(
-            f"{self.api_url}/media",
-            auth=self.auth,
-            headers=headers,
-            data=media_data,
-            timeout=60
-        )
-        
         if upload_response.status_code == 201:
-            media_info = upload_response.json()
+            media_info = _parse(upload_response)
             print(f"✓ Featured image uploaded successfully: {media_info['source_url']}")
             return (media_info['id'], media_info['source_url'])
         else:
@@ -761,23 +1270,14 @@ class WordPressPost:
             print(f"Warning: Featured image file '{filepath}' not found")
             return None
 
-        with open(filepath, 'rb') as f:
-            media_data = f.read()
-
         # Determine content type from the SOURCE file's extension (the on-disk
         # extension is authoritative; target_filename always preserves it).
         source_ext = os.path.splitext(os.path.basename(filepath))[1].lower()
-        content_type_map = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp',
-            '.pdf': 'application/pdf',
-            '.doc': 'application/msword',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-        }
-        content_type = content_type_map.get(source_ext, 'application/octet-stream')
+        content_type = (
+            _EXT_TO_MIME.get(source_ext)
+            or mimetypes.guess_type(filepath)[0]
+            or 'application/octet-stream'
+        )
 
         filename = target_filename or os.path.basename(filepath)
 
@@ -788,16 +1288,18 @@ class WordPressPost:
         
         print(f"Uploading featured image: {filename}")
 
-        response = requests.post(
-            f"{self.api_url}/media",
-            auth=self.auth,
-            headers=headers,
-            data=media_data,
-            timeout=60
-        )
+        # Stream the file as the request body (requests sizes it via fstat)
+        with open(filepath, 'rb') as f:
+            response = requests.post(
+                f"{self.api_url}/media",
+                auth=self.auth,
+                headers=headers,
+                data=f,
+                timeout=60
+            )
         
         if response.status_code == 201:
-            media_info = response.json()
+            media_info = _parse(response)
             print(f"✓ Featured image uploaded successfully: {media_info['source_url']}")
             return (media_info['id'], media_info['source_url'])
         else:
@@ -806,8 +1308,18 @@ class WordPressPost:
 
 
 def find_local_config():
-    """Walk up directory tree from cwd to find nearest .wp-poster.json"""
-    current = Path.cwd()
+    """Walk up directory tree from cwd to find nearest .wp-poster.json
+
+    The walk is memoized per working directory; the init commands clear it
+    after writing a config.
+    """
+    return _find_local_config(os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _find_local_config(cwd):
+    """Uncached walk behind find_local_config, for the given directory."""
+    current = Path(cwd)
     while current != current.parent:
         config_path = current / '.wp-poster.json'
         if config_path.exists():
@@ -845,6 +1357,8 @@ def find_translation_siblings(project_root, network_config, translation_set, exc
 
     Returns list of {"locale": ..., "blog_id": ..., "post_id": ...}.
     """
+    import yaml
+
     siblings = []
     sites = network_config.get('network', {}).get('sites', {})
 
@@ -868,14 +1382,11 @@ def find_translation_siblings(project_root, network_config, translation_set, exc
         for md_path in glob_mod.glob(os.path.join(content_path, '**', '*.md'), recursive=True):
             try:
                 # Reuse lightweight frontmatter parsing
-                with open(md_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-                if not file_content.startswith('---'):
-                    continue
-                parts = file_content.split('---', 2)
-                if len(parts) < 3:
+                file_content = _decode_source(Path(md_path).read_bytes())
+                end = _frontmatter_end(file_content)
+                if end == -1:
                     continue
-                fm = yaml.safe_load(parts[1]) or {}
+                fm = _yaml_safe_load(file_content[3:end]) or {}
                 if fm.get('translation_set') == translation_set and 'id' in fm:
                     siblings.append({
                         'locale': site_locale,
@@ -910,45 +1421,117 @@ def write_msls_links(wp_cli_alias, current_post, siblings):
         subprocess.run(cmd, capture_output=True, text=True, timeout=15)
 
 
+_FORMATS = (None, 'markdown', 'raw')
+
+
+def _build_format_table():
+    """Precompute resolve_format's answer for every (cli_md, cli_raw, fm, cfg) state."""
+    table = {}
+    for cli_markdown in (False, True):
+        for cli_raw in (False, True):
+            for fm_fmt in _FORMATS:
+                for cfg_fmt in _FORMATS:
+                    if cli_raw:
+                        fmt = 'raw'
+                    elif cli_markdown:
+                        fmt = 'markdown'
+                    else:
+                        fmt = fm_fmt or cfg_fmt or 'raw'
+                    table[(cli_markdown, cli_raw, fm_fmt, cfg_fmt)] = fmt
+    return table
+
+
+_FMT_TABLE = _build_format_table()
+
+
 def resolve_format(cli_markdown, cli_raw, frontmatter, config):
     """Resolve format: CLI > frontmatter > config > default(raw)"""
-    if cli_raw:
-        return 'raw'
-    if cli_markdown:
-        return 'markdown'
-    if frontmatter.get('format') in ('raw', 'markdown'):
-        return frontmatter['format']
-    if config.get('default_format') in ('raw', 'markdown'):
-        return config['default_format']
-    return 'raw'
+    fm_fmt = frontmatter.get('format')
+    cfg_fmt = config.get('default_format')
+    return _FMT_TABLE[(
+        bool(cli_markdown),
+        bool(cli_raw),
+        fm_fmt if fm_fmt in _FORMATS else None,
+        cfg_fmt if cfg_fmt in _FORMATS else None,
+    )]
+
+
+_SCRIPT_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _global_config_candidates():
+    """Non-project config locations, highest priority first, as (name, path)."""
+    home = Path.home()
+    return [
+        ('User global', home / '.wp-poster.json'),
+        ('XDG config', home / '.config/wp-poster/config.json'),
+        ('App default', _SCRIPT_DIR / '.wp-poster.json'),
+    ]
+
+
+def _probe(path):
+    """Return os.stat(path), or None if it can't be statted (e.g. missing)."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 
 def get_config_paths():
     """Get all config paths in precedence order with their status."""
-    script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
     local_config = find_local_config()
 
     paths = []
-    seen = set()
+    seen = set()  # (st_dev, st_ino) of listed files, so aliases appear once
 
     if local_config:
         paths.append(('Local project', local_config, True))
-        seen.add(local_config.resolve())
+        st = _probe(local_config)
+        if st:
+            seen.add((st.st_dev, st.st_ino))
+
+    # One stat per candidate gives both existence and identity
+    for name, path in _global_config_candidates():
+        st = _probe(path)
+        if st is None:
+            paths.append((name, path, False))
+        elif (st.st_dev, st.st_ino) not in seen:
+            paths.append((name, path, True))
+            seen.add((st.st_dev, st.st_ino))
 
-    candidates = [
-        ('User global', Path.home() / '.wp-poster.json'),
-        ('XDG config', Path.home() / '.config/wp-poster/config.json'),
-        ('App default', script_dir / '.wp-poster.json'),
-    ]
+    return paths
 
-    for name, path in candidates:
-        resolved = path.resolve() if path.exists() else path
-        if resolved not in seen:
-            paths.append((name, path, path.exists()))
-            if path.exists():
-                seen.add(resolved)
 
-    return paths
+def find_active_config():
+    """Return the path of the config file that load_config would use, or None.
+
+    Stops at the first existing candidate instead of probing (and resolving)
+    every location the way get_config_paths does for the help listing.
+    """
+    local_config = find_local_config()
+    if local_config:
+        return local_config
+    for _, path in _global_config_candidates():
+        if _probe(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path, mtime_ns, size):
+    """Parse a JSON config file, memoized on (path, mtime, size)."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _read_config_file(path):
+    """Parse a JSON config file via the _parse_config_file cache.
+
+    Keyed on the file's current stat, so a rewritten config is re-read.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    st = os.stat(path)
+    return _parse_config_file(os.fspath(path), st.st_mtime_ns, st.st_size)
 
 
 def load_config():
@@ -962,27 +1545,9 @@ def load_config():
     """
     config = {}
 
-    # Get the directory where this script is located
-    script_dir = Path(os.path.dirname(os.path.abspath(__file__)))
-
-    # Find local config by walking up directory tree
-    local_config = find_local_config()
-
-    # Check for config file in various locations (highest priority first)
-    config_paths = []
-    if local_config:
-        config_paths.append(local_config)
-    config_paths.extend([
-        Path.home() / '.wp-poster.json',
-        Path.home() / '.config/wp-poster/config.json',
-        script_dir / '.wp-poster.json',  # App default (lowest priority)
-    ])
-
-    for config_path in config_paths:
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                break
+    config_path = find_active_config()
+    if config_path:
+        config = dict(_read_config_file(config_path))
     
     # Override with environment variables
     if 'WP_SITE_URL' in os.environ:
@@ -998,7 +1563,7 @@ def load_config():
 def init_config():
     """Interactive configuration setup"""
     print("WordPress Poster Configuration Setup")
-    print("=" * 40)
+    print(_RULE)
     print("\nThis will create a .wp-poster.json file in the current directory.\n")
     
     # Check if config already exists
@@ -1015,7 +1580,7 @@ def init_config():
     while True:
         site_url = input("WordPress site URL (e.g., https://example.com): ").strip()
         if site_url:
-            if not site_url.startswith(('http://', 'https://')):
+            if not site_url.startswith(_URL_SCHEMES):
                 site_url = 'https://' + site_url
             config['site_url'] = site_url.rstrip('/')
             break
@@ -1044,6 +1609,7 @@ def init_config():
     try:
         response = requests.get(
             f"{config['site_url']}/wp-json/wp/v2/users/me",
+            params={'_fields': 'id,name'},
             auth=(config['username'], config['app_password']),
             timeout=10
         )
@@ -1100,6 +1666,7 @@ def init_config():
     # Save configuration
     with open(config_path, 'w') as f:
         json.dump(config, f, indent=2)
+    _find_local_config.cache_clear()
     
     print(f"\n✓ Configuration saved to: {config_path}")
     print("\nYou can now use: wp-post <file>")
@@ -1178,6 +1745,7 @@ def init_network_config():
     try:
         response = requests.get(
             f"{test_url}/wp-json/wp/v2/users/me",
+            params={'_fields': 'id,name'},
             auth=(username, app_password),
             timeout=10
         )
@@ -1244,6 +1812,7 @@ def init_network_config():
     root_config_path = project_root / '.wp-poster.json'
     with open(root_config_path, 'w') as f:
         json.dump(root_config, f, indent=2)
+    _find_local_config.cache_clear()
     print(f"  ✓ {root_config_path}")
 
     print(f"\n✓ Network project scaffolded with {len(sites_data)} site(s).")
@@ -1316,6 +1885,12 @@ images:
   cannot be scoped and will upload fresh on each run.
   --test mode skips all uploads.
 
+caching:
+  Category, tag, taxonomy term and author lookups are cached per site
+  in ~/.cache/wp-poster/ for 10 minutes so consecutive runs skip them.
+  --no-cache bypasses the cache for one run; --refresh re-fetches
+  everything and rewrites it.
+
 output:
   Omit id to create a new post; include id to update an existing one.
 
@@ -1350,6 +1925,11 @@ example file:
     parser.add_argument('--markdown', action='store_true', help='Convert markdown to Gutenberg blocks')
     parser.add_argument('--raw', action='store_true', help='Post content as-is (override format frontmatter)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Show detailed debug output')
+    parser.add_argument('--json', action='store_true', help='With no file: print config file discovery as JSON')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore and do not update the on-disk cache of category/tag/term/user lookups')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-fetch cached lookups from WordPress and rewrite the on-disk cache')
     
     args = parser.parse_args()
     
@@ -1363,11 +1943,10 @@ example file:
 
     # Handle --config-path flag
     if args.config_path:
-        config_paths = get_config_paths()
-        for name, path, exists in config_paths:
-            if exists:
-                print(path)
-                sys.exit(0)
+        active_path = find_active_config()
+        if active_path:
+            print(active_path)
+            sys.exit(0)
         print("No config file found", file=sys.stderr)
         sys.exit(1)
 
@@ -1386,7 +1965,7 @@ example file:
         try:
             response = requests.get(
                 f"{site_url.rstrip('/')}/wp-json/wp/v2/users/me",
-                params={'context': 'edit'},
+                params={'context': 'edit', '_fields': 'id,name,roles'},
                 auth=(username, app_password),
                 timeout=10
             )
@@ -1413,7 +1992,9 @@ example file:
             parser.print_help()
             sys.exit(1)
 
-        if not os.path.exists(args.file):
+        try:
+            source = _open_source(args.file)
+        except FileNotFoundError:
             print(f"Error: File '{args.file}' not found")
             sys.exit(1)
 
@@ -1422,54 +2003,69 @@ example file:
 
         # Resolve format: CLI > frontmatter > config > default
         config = load_config()
-        frontmatter_peek = poster.parse_frontmatter_only(args.file)
-        fmt = resolve_format(args.markdown, args.raw, frontmatter_peek, config)
+        with source:
+            frontmatter, content = poster.parse_raw_file(source)
+        fmt = resolve_format(args.markdown, args.raw, frontmatter, config)
 
         if fmt == 'markdown':
             print(f"Converting {args.file} to Gutenberg blocks...")
-            frontmatter, content = poster.parse_markdown_file(args.file)
+            content = poster.convert_markdown(content)
 
             print("Frontmatter:")
-            print("=" * 40)
-            print(yaml.dump(frontmatter, default_flow_style=False))
+            print(_RULE)
+            print(_fast_yaml_dump_flat(frontmatter))
 
             print("Generated Gutenberg blocks:")
-            print("=" * 40)
+            print(_RULE)
             print(content)
         else:
             print(f"Parsing {args.file} (no conversion)...")
-            frontmatter, content = poster.parse_raw_file(args.file)
 
             print("Frontmatter:")
-            print("=" * 40)
-            print(yaml.dump(frontmatter, default_flow_style=False))
+            print(_RULE)
+            print(_fast_yaml_dump_flat(frontmatter))
 
             print("Content:")
-            print("=" * 40)
+            print(_RULE)
             print(content)
         sys.exit(0)
     
     # If no file provided and not init/test, show help and config info
     if not args.file:
-        parser.print_help()
-        print("\nConfig files (in precedence order):")
+        if args.json:
+            config_paths = get_config_paths()
+            active_path = next((path for _, path, exists in config_paths if exists), None)
+            active_config = _read_config_file(active_path) if active_path else {}
+            print(_dumps({
+                'config_paths': [
+                    {'name': name, 'path': str(path), 'exists': exists}
+                    for name, path, exists in config_paths
+                ],
+                'active': str(active_path) if active_path else None,
+                'author_context': active_config.get('author_context'),
+            }))
+            sys.exit(0 if active_path else 1)
+
+        # Build the whole listing first and emit it with a single write
+        out = [parser.format_help(), "\nConfig files (in precedence order):\n"]
         config_paths = get_config_paths()
         active_found = False
         active_config = None
         for name, path, exists in config_paths:
             if exists and not active_found:
-                print(f"  ✓ {name}: {path} (active)")
+                out.append(f"  ✓ {name}: {path} (active)\n")
                 active_found = True
-                with open(path, 'r') as f:
-                    active_config = json.load(f)
+                active_config = _read_config_file(path)
             elif exists:
-                print(f"    {name}: {path}")
+                out.append(f"    {name}: {path}\n")
             else:
-                print(f"    {name}: {path} (not found)")
+                out.append(f"    {name}: {path} (not found)\n")
+        author_context = active_config.get('author_context') if active_config else None
         if not active_found:
-            print("  No config file found. Run 'wp-post --init' to create one.")
-        elif active_config and active_config.get('author_context'):
-            print(f"\nDefault author: {active_config['author_context']}")
+            out.append("  No config file found. Run 'wp-post --init' to create one.\n")
+        elif author_context:
+            out.append(f"\nDefault author: {author_context}\n")
+        sys.stdout.write(''.join(out))
         sys.exit(1)
     
     # Load configuration
@@ -1484,26 +2080,27 @@ example file:
         config['app_password'] = args.app_password
     
     # Validate required configuration
-    required = ['site_url', 'username', 'app_password']
-    missing = [key for key in required if key not in config]
-    
+    missing = _REQUIRED - config.keys()
+
     if missing:
-        print(f"Error: Missing configuration: {', '.join(missing)}")
-        print("\nNo configuration found. Run 'wp-post --init' to set up your credentials interactively.")
-        print("\nAlternatively, you can provide configuration through:")
-        print("1. Command line arguments (--site-url, --username, --app-password)")
-        print("2. Environment variables (WP_SITE_URL, WP_USERNAME, WP_APP_PASSWORD)")
-        print("3. Config file (~/.wp-poster.json or .wp-poster.json in current directory)")
-        print("\nExample config file:")
-        print(json.dumps({
-            "site_url": "https://your-site.com",
-            "username": "your-username",
-            "app_password": "your-app-password"
-        }, indent=2))
+        out = [
+            f"Error: Missing configuration: {', '.join(sorted(missing))}\n",
+            "\nNo configuration found. Run 'wp-post --init' to set up your credentials interactively.\n",
+            "\nAlternatively, you can provide configuration through:\n",
+            "1. Command line arguments (--site-url, --username, --app-password)\n",
+            "2. Environment variables (WP_SITE_URL, WP_USERNAME, WP_APP_PASSWORD)\n",
+            "3. Config file (~/.wp-poster.json or .wp-poster.json in current directory)\n",
+            "\nExample config file:\n",
+            _EXAMPLE_CONFIG_JSON,
+            "\n",
+        ]
+        sys.stdout.write(''.join(out))
         sys.exit(1)
     
-    # Check if file exists
-    if not os.path.exists(args.file):
+    # Open the file once; it is parsed from this handle and not reopened
+    try:
+        source = _open_source(args.file)
+    except FileNotFoundError:
         print(f"Error: File '{args.file}' not found")
         sys.exit(1)
     
@@ -1511,12 +2108,16 @@ example file:
     poster = WordPressPost(
         config['site_url'],
         config['username'],
-        config['app_password']
+        config['app_password'],
+        disk_cache=not args.no_cache,
+        refresh=args.refresh,
     )
 
-    # Resolve format: CLI > frontmatter > config > default
-    frontmatter_peek = poster.parse_frontmatter_only(args.file)
-    fmt = resolve_format(args.markdown, args.raw, frontmatter_peek, config)
+    # Parse once; resolve format (CLI > frontmatter > config > default) from
+    # the same frontmatter that gets posted
+    with source:
+        frontmatter, content = poster.parse_raw_file(source)
+    fmt = resolve_format(args.markdown, args.raw, frontmatter, config)
 
     print(f"Posting {args.file} to {config['site_url']}...")
     result = poster.post_to_wordpress(
@@ -1524,21 +2125,22 @@ example file:
         draft=args.draft,
         raw=(fmt == 'raw'),
         author_context=config.get('author_context'),
-        verbose=args.verbose
+        verbose=args.verbose,
+        pre_parsed=(frontmatter, content),
     )
 
     if result is None:
         sys.exit(1)
 
     if result['success']:
-        print(json.dumps({
+        print(_dumps({
             'success': True,
             'id': result['id'],
             'title': result['title'],
             'url': result['url']
         }))
     else:
-        print(json.dumps({
+        print(_dumps({
             'success': False,
             'error': result['error']
         }))